@@ -12,6 +12,7 @@ import json
 import sys
 import os
 import re
+import mmap
 
 # Add hooks directory to path for shared modules
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -25,75 +26,155 @@ MAX_MESSAGES_TO_ANALYZE = 30
 # Minimum failures needed to trigger (conservative)
 MIN_FAILURES_FOR_TRIGGER = 3
 
+# Common error patterns
+ERROR_PATTERNS = [
+    r'error:',
+    r'Error:',
+    r'ERROR',
+    r'failed',
+    r'Failed',
+    r'FAILED',
+    r'exception',
+    r'Exception',
+    r'not found',
+    r'No such file',
+    r'Permission denied',
+    r'command not found',
+    r'ModuleNotFoundError',
+    r'ImportError',
+    r'SyntaxError',
+    r'TypeError',
+    r'ValueError',
+    r'exit code [1-9]',
+]
+
+# Patterns that look like a success after failure (case-insensitive)
+SUCCESS_PATTERNS = [
+    r'worked',
+    r'success',
+    r'fixed',
+    r'resolved',
+    r'completed',
+    r'exit code 0',
+]
+
+# Phrases indicating trial-and-error (case-insensitive)
+TRIAL_ERROR_PATTERNS = [
+    r'let me try',
+    r'trying again',
+    r'another approach',
+    r'different approach',
+    r'turns out',
+    r'the issue was',
+    r'the problem was',
+    r'that didn\'t work',
+    r'that failed',
+    r'I\'ll try',
+    r'attempting',
+    r'workaround',
+]
+
+# Each pattern list is merged into one alternation so a message is scanned once
+ERROR_RE = re.compile("|".join(ERROR_PATTERNS))
+SUCCESS_RE = re.compile("|".join(SUCCESS_PATTERNS), re.IGNORECASE)
+TRIAL_ERROR_RE = re.compile("|".join(TRIAL_ERROR_PATTERNS), re.IGNORECASE)
+
 def load_transcript(transcript_path):
-    """Load conversation transcript from JSONL file."""
-    messages = []
+    """
+    Load the tail of a conversation transcript from a JSONL file.
+
+    The file is memory-mapped and newlines are located backwards from the end,
+    so only the last MAX_MESSAGES_TO_ANALYZE non-empty lines are ever read.
+    """
+    tail = []
     try:
-        with open(transcript_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    try:
-                        messages.append(json.loads(line))
-                    except json.JSONDecodeError:
-                        continue
-    except (FileNotFoundError, IOError):
+        with open(transcript_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                pos = len(mm)
+                while pos > 0 and len(tail) < MAX_MESSAGES_TO_ANALYZE:
+                    newline = mm.rfind(b"\n", 0, pos)
+                    line = mm[newline + 1:pos].strip()
+                    if line:
+                        tail.append(line)
+                    pos = newline
+    except (FileNotFoundError, IOError, ValueError):
+        # ValueError: empty files cannot be mapped
         pass
+
+    messages = []
+    for line in reversed(tail):
+        try:
+            messages.append(json.loads(line))
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            continue
     return messages
 
+def tool_result_text(content):
+    """Flatten tool_result content (string or list of text blocks) to a string."""
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return "\n".join(
+            item.get("text", "") for item in content
+            if isinstance(item, dict) and item.get("type") == "text"
+        )
+    return ""
+
+def iter_message_blocks(msg):
+    """
+    Yield (block_type, text, is_error) for the text-bearing blocks of a message.
+
+    Only plain text and tool_result output are yielded, so large tool inputs
+    are never scanned. is_error is the tool_result flag when present, else None.
+    """
+    message = msg.get("message", {})
+    content = message.get("content", "") if isinstance(message, dict) else ""
+
+    if isinstance(content, str):
+        yield "text", content, None
+        return
+    if not isinstance(content, list):
+        return
+
+    for item in content:
+        if not isinstance(item, dict):
+            continue
+        item_type = item.get("type")
+        if item_type == "tool_result":
+            yield "tool_result", tool_result_text(item.get("content")), item.get("is_error")
+        elif item_type == "text":
+            yield "text", item.get("text", ""), None
+
+def is_failure_message(msg):
+    """Check whether a message reports a tool failure."""
+    for block_type, text, is_error in iter_message_blocks(msg):
+        if block_type != "tool_result":
+            continue
+        # is_error is authoritative; only fall back to regex when it's absent
+        if is_error is None:
+            if ERROR_RE.search(text):
+                return True
+        elif is_error:
+            return True
+    return False
+
 def count_tool_failures(messages):
     """Count tool execution failures in recent messages."""
     failures = 0
     successes_after_failure = 0
     saw_failure = False
 
-    for msg in messages[-MAX_MESSAGES_TO_ANALYZE:]:
+    for msg in messages:
         # Look for tool results with errors
-        content = str(msg)
-
-        # Common error patterns
-        error_patterns = [
-            r'error:',
-            r'Error:',
-            r'ERROR',
-            r'failed',
-            r'Failed',
-            r'FAILED',
-            r'exception',
-            r'Exception',
-            r'not found',
-            r'No such file',
-            r'Permission denied',
-            r'command not found',
-            r'ModuleNotFoundError',
-            r'ImportError',
-            r'SyntaxError',
-            r'TypeError',
-            r'ValueError',
-            r'exit code [1-9]',
-        ]
-
-        for pattern in error_patterns:
-            if re.search(pattern, content):
-                failures += 1
-                saw_failure = True
-                break
-        else:
-            # No error in this message
-            if saw_failure:
-                # Check if this looks like a success after failure
-                success_patterns = [
-                    r'worked',
-                    r'success',
-                    r'fixed',
-                    r'resolved',
-                    r'completed',
-                    r'exit code 0',
-                ]
-                for pattern in success_patterns:
-                    if re.search(pattern, content, re.IGNORECASE):
-                        successes_after_failure += 1
-                        break
+        if is_failure_message(msg):
+            failures += 1
+            saw_failure = True
+        elif saw_failure:
+            # No error in this message, check if it looks like a success after failure
+            for _, text, _ in iter_message_blocks(msg):
+                if SUCCESS_RE.search(text):
+                    successes_after_failure += 1
+                    break
 
     return failures, successes_after_failure
 
@@ -101,25 +182,11 @@ def detect_trial_and_error_phrases(messages):
     """Detect phrases indicating trial-and-error in assistant messages."""
     phrases_found = 0
 
-    trial_error_patterns = [
-        r'let me try',
-        r'trying again',
-        r'another approach',
-        r'different approach',
-        r'turns out',
-        r'the issue was',
-        r'the problem was',
-        r'that didn\'t work',
-        r'that failed',
-        r'I\'ll try',
-        r'attempting',
-        r'workaround',
-    ]
-
-    for msg in messages[-MAX_MESSAGES_TO_ANALYZE:]:
-        content = str(msg)
-        for pattern in trial_error_patterns:
-            if re.search(pattern, content, re.IGNORECASE):
+    for msg in messages:
+        if msg.get("type") != "assistant":
+            continue
+        for _, text, _ in iter_message_blocks(msg):
+            if TRIAL_ERROR_RE.search(text):
                 phrases_found += 1
                 break  # Count each message once
 
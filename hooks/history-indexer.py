@@ -13,11 +13,12 @@ import sys
 import os
 import re
 from datetime import datetime
-from pathlib import Path
 
 # Add hooks directory to path for shared modules
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from hook_logger import HookLogger
+from session_discovery import scan_session_files, session_info_from_entry
+from json_compat import HAS_ORJSON, orjson, json_loads
 
 logger = HookLogger("history-indexer")
 
@@ -26,8 +27,11 @@ HISTORY_DIR = os.path.expanduser("~/.claude/history")
 INDEX_PATH = os.path.join(HISTORY_DIR, "index.json")
 PROJECTS_DIR = os.path.expanduser("~/.claude/projects")
 
+# Index format version (2: topic postings stored as parallel arrays)
+INDEX_VERSION = 2
+
 # Topics to extract (domain keywords)
-DOMAIN_KEYWORDS = {
+DOMAIN_KEYWORDS = frozenset({
     "authentication", "auth", "login", "logout", "jwt", "oauth", "session",
     "database", "sql", "postgres", "mysql", "sqlite", "mongodb", "redis",
     "api", "rest", "graphql", "endpoint", "route", "http", "request",
@@ -40,7 +44,16 @@ DOMAIN_KEYWORDS = {
     "refactor", "optimize", "performance", "cache",
     "ui", "frontend", "react", "vue", "component",
     "backend", "server", "node", "python", "deno", "bun",
-}
+})
+
+# Content is split into words once and intersected with DOMAIN_KEYWORDS
+WORD_RE = re.compile(r"\w+")
+
+# Quoted source file names, used as topics (base name only)
+TOPIC_FILE_RE = re.compile(r'["\']([^"\']+\.(?:py|ts|js|md|json|tsx|jsx|css|html))["\']')
+
+# Quoted or backticked file paths mentioned in content
+FILE_RE = re.compile(r'(?:["\']|`)([^"\'`]+\.(?:py|ts|js|md|json|tsx|jsx|css|html|yml|yaml))(?:["\']|`)')
 
 
 def ensure_history_dir():
@@ -55,7 +68,7 @@ def load_index():
             return json.load(f)
     except (FileNotFoundError, json.JSONDecodeError):
         return {
-            "version": 1,
+            "version": INDEX_VERSION,
             "last_indexed": None,
             "sessions": {},
             "topics": {}
@@ -66,49 +79,40 @@ def save_index(index):
     """Save index to disk."""
     ensure_history_dir()
     index["last_indexed"] = datetime.now().isoformat()
-    with open(INDEX_PATH, 'w') as f:
-        json.dump(index, f, indent=2)
+    # Compact JSON: the index is only ever read by the hooks
+    if HAS_ORJSON:
+        with open(INDEX_PATH, 'wb') as f:
+            f.write(orjson.dumps(index))
+    else:
+        with open(INDEX_PATH, 'w') as f:
+            json.dump(index, f, separators=(",", ":"))
 
 
 def find_session_files():
-    """Find all session JSONL files across all projects."""
-    sessions = []
-    if not os.path.exists(PROJECTS_DIR):
-        return sessions
+    """
+    Find all session JSONL files across all projects.
 
-    for project_dir in Path(PROJECTS_DIR).iterdir():
-        if not project_dir.is_dir():
-            continue
-        # Skip hidden directories and subagents
-        if project_dir.name.startswith('.'):
+    Each entry carries the file size from the directory scan, so main()
+    can skip unchanged sessions without another stat.
+    """
+    sessions = []
+    for file_entry, project_name in scan_session_files(PROJECTS_DIR):
+        info = session_info_from_entry(file_entry, project_name)
+        try:
+            info["size"] = file_entry.stat().st_size
+        except OSError:
             continue
-
-        for jsonl_file in project_dir.glob("*.jsonl"):
-            # Skip subagent files
-            if "subagents" in str(jsonl_file):
-                continue
-            sessions.append({
-                "path": str(jsonl_file),
-                "project": project_dir.name,
-                "session_id": jsonl_file.stem
-            })
-
+        sessions.append(info)
     return sessions
 
 
 def extract_topics_from_content(content):
     """Extract topics from message content."""
-    topics = set()
-    content_lower = content.lower()
-
-    # Domain keywords
-    for keyword in DOMAIN_KEYWORDS:
-        if keyword in content_lower:
-            topics.add(keyword)
+    # Domain keywords (whole words only)
+    topics = set(WORD_RE.findall(content.lower())) & DOMAIN_KEYWORDS
 
     # File paths (extract base names)
-    files = re.findall(r'["\']([^"\']+\.(py|ts|js|md|json|tsx|jsx|css|html))["\']', content)
-    for file_path, _ in files:
+    for file_path in TOPIC_FILE_RE.findall(content):
         base = os.path.basename(file_path).split('.')[0]
         if len(base) > 2:
             topics.add(base.lower())
@@ -118,81 +122,90 @@ def extract_topics_from_content(content):
 
 def extract_files_from_content(content):
     """Extract file paths mentioned in content."""
-    files = set()
-
-    # Match file paths in various formats
-    patterns = [
-        r'["\']([^"\']+\.(py|ts|js|md|json|tsx|jsx|css|html|yml|yaml))["\']',
-        r'`([^`]+\.(py|ts|js|md|json|tsx|jsx|css|html|yml|yaml))`',
-    ]
-
-    for pattern in patterns:
-        matches = re.findall(pattern, content)
-        for match in matches:
-            if isinstance(match, tuple):
-                files.add(match[0])
-            else:
-                files.add(match)
+    return list(set(FILE_RE.findall(content)))[:20]  # Limit to avoid bloat
 
-    return list(files)[:20]  # Limit to avoid bloat
 
+def index_session(session_info, existing=None):
+    """
+    Index a single session file.
 
-def index_session(session_info):
-    """Index a single session file."""
+    If an existing entry with a byte_offset is given, only the lines appended
+    since that offset are parsed and merged into the existing entry.
+    """
     path = session_info["path"]
 
-    try:
-        with open(path, 'r') as f:
-            lines = f.readlines()
-    except (FileNotFoundError, IOError):
-        return None
-
+    offset = 0
+    line_count = 0
     all_topics = set()
     all_files = set()
     tools_used = {}
     date = None
 
-    # Process each line
-    for i, line in enumerate(lines):
-        line = line.strip()
-        if not line:
-            continue
+    if existing and "byte_offset" in existing:
+        offset = existing["byte_offset"]
+        line_count = existing.get("line_count", 0)
+        all_topics.update(existing.get("topics", []))
+        all_files.update(existing.get("files_touched", []))
+        tools_used.update(existing.get("tools_used", {}))
+        date = existing.get("date")
 
-        try:
-            msg = json.loads(line)
-        except json.JSONDecodeError:
-            continue
+    try:
+        f = open(path, 'rb')
+    except (FileNotFoundError, IOError):
+        return None
+
+    with f:
+        # Size before reading; lines appended while we read are caught next run
+        size_bytes = os.fstat(f.fileno()).st_size
+        f.seek(offset)
+
+        # Process each new line
+        for line in f:
+            # Stop at a partially written last line, it gets picked up next time
+            if not line.endswith(b"\n"):
+                break
+            offset += len(line)
+            line_count += 1
+
+            line = line.strip()
+            if not line:
+                continue
+
+            try:
+                msg = json_loads(line)
+            except json.JSONDecodeError:
+                continue
 
-        # Get date from first message
-        if not date and msg.get("timestamp"):
-            ts = msg.get("timestamp", "")
-            if isinstance(ts, str) and "T" in ts:
-                date = ts.split("T")[0]
-
-        # Extract from user messages
-        if msg.get("type") == "user":
-            content = msg.get("message", {}).get("content", "")
-            if isinstance(content, str):
-                all_topics.update(extract_topics_from_content(content))
-                all_files.update(extract_files_from_content(content))
-
-        # Extract from assistant messages (tool usage)
-        if msg.get("type") == "assistant":
-            message = msg.get("message", {})
-            content_list = message.get("content", [])
-            if isinstance(content_list, list):
-                for item in content_list:
-                    if isinstance(item, dict) and item.get("type") == "tool_use":
-                        tool_name = item.get("name", "unknown")
-                        tools_used[tool_name] = tools_used.get(tool_name, 0) + 1
-
-                        # Extract from tool input
-                        tool_input = item.get("input", {})
-                        if isinstance(tool_input, dict):
-                            for val in tool_input.values():
-                                if isinstance(val, str):
-                                    all_topics.update(extract_topics_from_content(val))
-                                    all_files.update(extract_files_from_content(val))
+            # Get date from first message
+            if not date and msg.get("timestamp"):
+                ts = msg.get("timestamp", "")
+                if isinstance(ts, str) and "T" in ts:
+                    date = ts.split("T")[0]
+
+            # Extract from user messages
+            if msg.get("type") == "user":
+                content = msg.get("message", {}).get("content", "")
+                if isinstance(content, str):
+                    all_topics.update(extract_topics_from_content(content))
+                    all_files.update(extract_files_from_content(content))
+
+            # Extract from assistant messages (tool usage)
+            if msg.get("type") == "assistant":
+                message = msg.get("message", {})
+                content_list = message.get("content", [])
+                if isinstance(content_list, list):
+                    for item in content_list:
+                        if isinstance(item, dict) and item.get("type") == "tool_use":
+                            tool_name = item.get("name", "unknown")
+                            tools_used[tool_name] = tools_used.get(tool_name, 0) + 1
+
+                            # Extract from tool input
+                            tool_input = item.get("input", {})
+                            if isinstance(tool_input, dict):
+                                for val in tool_input.values():
+                                    if isinstance(val, str):
+                                        all_topics.update(extract_topics_from_content(val))
+                                        all_files.update(extract_files_from_content(val))
 
     # Build session index entry
     return {
@@ -200,31 +213,78 @@ def index_session(session_info):
         "project": session_info["project"],
         "file": path,
         "date": date or datetime.now().strftime("%Y-%m-%d"),
-        "line_count": len(lines),
+        "line_count": line_count,
+        "byte_offset": offset,
+        "size_bytes": max(size_bytes, offset),
         "topics": list(all_topics)[:30],  # Limit topics
         "files_touched": list(all_files)[:20],
         "tools_used": dict(sorted(tools_used.items(), key=lambda x: x[1], reverse=True)[:10])
     }
 
 
+def sort_postings(postings):
+    """Sort a topic's parallel posting arrays by date (newest first)."""
+    dates = postings["dates"]
+    order = sorted(range(len(dates)), key=dates.__getitem__, reverse=True)
+    for key in ("sessions", "projects", "dates"):
+        column = postings[key]
+        postings[key] = [column[i] for i in order]
+
+
 def build_topic_index(sessions_dict):
-    """Build inverted topic index from sessions."""
+    """
+    Build inverted topic index from sessions.
+
+    Each topic maps to parallel arrays:
+    {"sessions": [...], "projects": [...], "dates": [...]}
+    """
     topics = {}
 
     for session_id, session in sessions_dict.items():
         project = session.get("project", "")
+        date = session.get("date", "")
         for topic in session.get("topics", []):
             if topic not in topics:
-                topics[topic] = []
-            topics[topic].append({
-                "session": session_id,
-                "project": project,
-                "date": session.get("date", "")
-            })
+                topics[topic] = {"sessions": [], "projects": [], "dates": []}
+            postings = topics[topic]
+            postings["sessions"].append(session_id)
+            postings["projects"].append(project)
+            postings["dates"].append(date)
 
     # Sort entries by date (newest first)
-    for topic in topics:
-        topics[topic].sort(key=lambda x: x.get("date", ""), reverse=True)
+    for postings in topics.values():
+        sort_postings(postings)
+
+    return topics
+
+
+def update_topic_index(topics, sessions_dict, changed):
+    """
+    Patch the inverted topic index for sessions that were (re)indexed.
+
+    changed maps session_id -> topics the session had before this run, so
+    only the postings of those sessions are replaced.
+    """
+    for session_id, old_topics in changed.items():
+        session = sessions_dict[session_id]
+        new_topics = set(session.get("topics", []))
+
+        for topic in set(old_topics) | new_topics:
+            postings = topics.get(topic, {"sessions": [], "projects": [], "dates": []})
+            keep = [i for i, sid in enumerate(postings["sessions"]) if sid != session_id]
+            postings = {key: [postings[key][i] for i in keep] for key in ("sessions", "projects", "dates")}
+
+            if topic in new_topics:
+                postings["sessions"].append(session_id)
+                postings["projects"].append(session.get("project", ""))
+                postings["dates"].append(session.get("date", ""))
+                # Keep entries sorted by date (newest first)
+                sort_postings(postings)
+
+            if postings["sessions"]:
+                topics[topic] = postings
+            else:
+                topics.pop(topic, None)
 
     return topics
 
@@ -256,32 +316,38 @@ def main():
     logger.debug(f"Found {len(session_files)} session files")
 
     # Index new or updated sessions
-    new_sessions = 0
+    changed = {}
     for session_info in session_files:
         session_id = session_info["session_id"]
-        path = session_info["path"]
 
         # Check if already indexed and file hasn't grown
+        existing = None
         if session_id in existing_sessions:
             existing = index["sessions"].get(session_id, {})
-            try:
-                current_lines = sum(1 for _ in open(path))
-                if current_lines <= existing.get("line_count", 0):
+            if "byte_offset" in existing:
+                # Size comes from the directory scan; a trailing partial line doesn't count as growth
+                if session_info["size"] <= existing.get("size_bytes", existing["byte_offset"]):
                     continue  # Already indexed, no new content
-            except:
-                continue
+            else:
+                existing = None  # Entry predates offsets, re-index from the start
 
-        # Index the session
-        session_entry = index_session(session_info)
+        # Index the session (only new content if we have an offset)
+        session_entry = index_session(session_info, existing)
         if session_entry:
+            old_topics = index["sessions"].get(session_id, {}).get("topics", [])
             index["sessions"][session_id] = session_entry
-            new_sessions += 1
-
-    # Rebuild topic index if any changes
-    if new_sessions > 0:
-        index["topics"] = build_topic_index(index["sessions"])
+            changed[session_id] = old_topics
+
+    # Update topic index if any changes (or if it's in an older format)
+    outdated = index.get("version") != INDEX_VERSION
+    if changed or outdated:
+        if index.get("topics") and not outdated:
+            update_topic_index(index["topics"], index["sessions"], changed)
+        else:
+            index["topics"] = build_topic_index(index["sessions"])
+            index["version"] = INDEX_VERSION
         save_index(index)
-        logger.info(f"Indexed {new_sessions} new sessions")
+        logger.info(f"Indexed {len(changed)} new sessions")
     else:
         logger.debug("No new sessions to index")
 
@@ -11,7 +11,7 @@ Output: Matching history segments injected as additionalContext
 import json
 import sys
 import os
-from datetime import datetime
+from datetime import datetime, timedelta
 
 # Add hooks directory to path for shared modules
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -26,7 +26,7 @@ INDEX_PATH = os.path.expanduser("~/.claude/history/index.json")
 MIN_SCORE_THRESHOLD = 8
 
 # Common words to ignore when scoring
-COMMON_WORDS = {
+COMMON_WORDS = frozenset({
     "a", "an", "the", "with", "and", "or", "for", "to", "in", "on", "by",
     "is", "are", "was", "were", "be", "been", "being", "have", "has", "had",
     "do", "does", "did", "will", "would", "could", "should", "may", "might",
@@ -34,7 +34,11 @@ COMMON_WORDS = {
     "your", "we", "our", "they", "them", "their", "what", "which", "who",
     "how", "when", "where", "why", "can", "help", "want", "need", "please",
     "make", "create", "add", "use", "using", "get", "set", "new", "file"
-}
+})
+
+# Translation tables for project keys and word splitting
+_PROJ_TRANS = str.maketrans({"/": "-", " ": "-"})
+_WORD_TRANS = str.maketrans({"-": " ", "_": " "})
 
 
 def load_index():
@@ -52,47 +56,66 @@ def normalize_project_path(cwd):
         return None
     # Convert /Users/foo/bar to -Users-foo-bar format
     # Keep leading dash to match how Claude Code stores project keys
-    normalized = cwd.replace("/", "-").replace(" ", "-")
+    normalized = cwd.translate(_PROJ_TRANS)
     # Ensure it starts with a dash (Claude Code format)
     if not normalized.startswith("-"):
         normalized = "-" + normalized
     return normalized
 
 
-def score_session(session, prompt_words, topics_index):
+def find_candidates(topics_index, prompt_words, current_project=None):
     """
-    Score a session against the user prompt.
+    Look up candidate sessions in the inverted topic index.
 
-    Scoring:
+    Only sessions sharing a topic with the prompt are returned, with their
+    topic score accumulated during the lookup:
     - Exact topic match: +4 per topic
-    - Partial topic match: +2 per topic word
+    - Partial topic match: +2 per topic word (for compound topics like foo_bar)
+    """
+    candidates = {}
+
+    def add(topic, points):
+        postings = topics_index.get(topic)
+        if not isinstance(postings, dict):
+            return  # Missing, or written by an older indexer
+        for session_id, project in zip(postings["sessions"], postings["projects"]):
+            # Filter to current project
+            if current_project and project != current_project:
+                continue
+            score, matching_topics = candidates.get(session_id, (0, []))
+            matching_topics.append(topic)
+            candidates[session_id] = (score + points, matching_topics)
+
+    # Exact matches
+    for word in prompt_words:
+        add(word, 4)
+
+    # Partial matches (word in topic matches word in prompt)
+    for topic in topics_index:
+        if topic in prompt_words or ("-" not in topic and "_" not in topic):
+            continue
+        topic_words = set(topic.translate(_WORD_TRANS).split())
+        meaningful_matches = (topic_words & prompt_words) - COMMON_WORDS
+        if meaningful_matches:
+            add(topic, len(meaningful_matches) * 2)
+
+    return candidates
+
+
+def score_session(session, prompt_words, topic_score, matching_topics, cutoff_7, cutoff_30):
+    """
+    Finish scoring a candidate session found via the topic index.
+
+    Scoring (on top of the topic score):
     - Recent session (< 7 days): +2
     - File match: +3 per file
+
+    cutoff_7 and cutoff_30 are ISO dates; ISO dates compare correctly as strings.
     """
-    score = 0
-    matching_topics = []
-
-    session_topics = set(session.get("topics", []))
-    session_files = set(session.get("files_touched", []))
-
-    # Check topic matches
-    for topic in session_topics:
-        topic_lower = topic.lower()
-        # Exact match
-        if topic_lower in prompt_words:
-            score += 4
-            matching_topics.append(topic)
-        else:
-            # Partial match (word in topic matches word in prompt)
-            topic_words = set(topic_lower.replace("-", " ").replace("_", " ").split())
-            matches = topic_words & prompt_words
-            meaningful_matches = matches - COMMON_WORDS
-            if meaningful_matches:
-                score += len(meaningful_matches) * 2
-                matching_topics.append(topic)
+    score = topic_score
 
     # Check file matches
-    for file_path in session_files:
+    for file_path in session.get("files_touched", []):
         file_name = os.path.basename(file_path).lower()
         file_base = file_name.split('.')[0]
         if file_base in prompt_words and len(file_base) > 2:
@@ -101,15 +124,10 @@ def score_session(session, prompt_words, topics_index):
     # Recency bonus
     session_date = session.get("date", "")
     if session_date:
-        try:
-            date_obj = datetime.strptime(session_date, "%Y-%m-%d")
-            days_ago = (datetime.now() - date_obj).days
-            if days_ago <= 7:
-                score += 2
-            elif days_ago <= 30:
-                score += 1
-        except ValueError:
-            pass
+        if session_date >= cutoff_7:
+            score += 2
+        elif session_date >= cutoff_30:
+            score += 1
 
     return score, matching_topics[:5]
 
@@ -137,9 +155,9 @@ def main():
         sys.exit(0)
 
     # Prepare prompt for matching
-    prompt_lower = prompt.lower()
-    prompt_words = set(prompt_lower.replace("-", " ").replace("_", " ").split())
-    meaningful_words = prompt_words - COMMON_WORDS
+    meaningful_words = {
+        w for w in prompt.lower().translate(_WORD_TRANS).split() if w not in COMMON_WORDS
+    }
 
     if len(meaningful_words) < 2:
         sys.exit(0)  # Not enough meaningful words to search
@@ -154,14 +172,23 @@ def main():
     # Get current project key for filtering
     current_project = normalize_project_path(cwd)
 
-    # Score all sessions (filter to current project by default)
+    # Only score sessions that share a topic with the prompt
+    candidates = find_candidates(index.get("topics", {}), meaningful_words, current_project)
+
+    # Recency cutoffs, computed once per prompt
+    today = datetime.now().date()
+    cutoff_7 = (today - timedelta(days=7)).isoformat()
+    cutoff_30 = (today - timedelta(days=30)).isoformat()
+
     scored_sessions = []
-    for session_id, session in sessions.items():
-        # Filter to current project
-        if current_project and session.get("project") != current_project:
+    for session_id, (topic_score, matching_topics) in candidates.items():
+        session = sessions.get(session_id)
+        if not session:
             continue
 
-        score, matching_topics = score_session(session, meaningful_words, index.get("topics", {}))
+        score, matching_topics = score_session(
+            session, meaningful_words, topic_score, matching_topics, cutoff_7, cutoff_30
+        )
 
         if score >= MIN_SCORE_THRESHOLD:
             scored_sessions.append({
@@ -7,16 +7,19 @@ Usage:
     logger = HookLogger("hook-name")
     logger.info("Processing started")
     logger.error("Something went wrong", exc_info=True)
+
+Set CLAUDE_HOOK_LOG=0 to disable logging; get_logger() then returns a
+NullLogger that discards everything.
 """
 
 import os
 import json
-import traceback
+import atexit
 from datetime import datetime
-from pathlib import Path
 
-# Log directory
-LOG_DIR = Path(os.path.expanduser("~/.claude/hooks/logs"))
+# Log directory (plain os.path: pathlib and traceback cost more to import
+# than the rest of a typical hook run)
+LOG_DIR = os.path.expanduser("~/.claude/hooks/logs")
 
 # Max log file size (1MB)
 MAX_LOG_SIZE = 1_000_000
@@ -24,31 +27,53 @@ MAX_LOG_SIZE = 1_000_000
 # Max log files to keep per hook
 MAX_LOG_FILES = 3
 
+# Set once the log directory has been created in this process
+_DIR_READY = False
+
 
 class HookLogger:
     def __init__(self, hook_name: str):
+        global _DIR_READY
         self.hook_name = hook_name
         self.log_dir = LOG_DIR
-        self.log_dir.mkdir(parents=True, exist_ok=True)
-        self.log_file = self.log_dir / f"{hook_name}.log"
-        self._rotate_if_needed()
-
-    def _rotate_if_needed(self):
-        """Rotate log file if it exceeds max size."""
-        if self.log_file.exists() and self.log_file.stat().st_size > MAX_LOG_SIZE:
-            # Rotate existing logs
-            for i in range(MAX_LOG_FILES - 1, 0, -1):
-                old_file = self.log_dir / f"{self.hook_name}.{i}.log"
-                new_file = self.log_dir / f"{self.hook_name}.{i + 1}.log"
-                if old_file.exists():
-                    if i + 1 >= MAX_LOG_FILES:
-                        old_file.unlink()  # Delete oldest
-                    else:
-                        old_file.rename(new_file)
-
-            # Rotate current to .1
-            backup = self.log_dir / f"{self.hook_name}.1.log"
-            self.log_file.rename(backup)
+        if not _DIR_READY:
+            os.makedirs(self.log_dir, exist_ok=True)
+            _DIR_READY = True
+        self.log_file = os.path.join(self.log_dir, f"{hook_name}.log")
+        self._fh = None
+        self._buf = []
+        # Entries are written in one batch when the hook exits (sys.exit included)
+        atexit.register(self.flush)
+
+    def _open(self):
+        """Open the log file on first write, kept open for the rest of the process."""
+        if self._fh is None:
+            self._fh = open(self.log_file, "a")
+            if self._rotate_if_needed(os.fstat(self._fh.fileno()).st_size):
+                self._fh = open(self.log_file, "a")
+        return self._fh
+
+    def _rotate_if_needed(self, size: int) -> bool:
+        """Rotate log file if it exceeds max size. Returns True if rotated."""
+        if size <= MAX_LOG_SIZE:
+            return False
+
+        self._fh.close()
+
+        # Rotate existing logs
+        for i in range(MAX_LOG_FILES - 1, 0, -1):
+            old_file = os.path.join(self.log_dir, f"{self.hook_name}.{i}.log")
+            new_file = os.path.join(self.log_dir, f"{self.hook_name}.{i + 1}.log")
+            if os.path.exists(old_file):
+                if i + 1 >= MAX_LOG_FILES:
+                    os.remove(old_file)  # Delete oldest
+                else:
+                    os.replace(old_file, new_file)
+
+        # Rotate current to .1
+        backup = os.path.join(self.log_dir, f"{self.hook_name}.1.log")
+        os.replace(self.log_file, backup)
+        return True
 
     def _write(self, level: str, message: str, **kwargs):
         """Write a log entry."""
@@ -63,17 +88,29 @@ class HookLogger:
 
         # Add any extra data
         if kwargs.get("exc_info"):
+            import traceback  # Only needed when logging an exception
             entry["traceback"] = traceback.format_exc()
 
         if kwargs.get("data"):
             entry["data"] = kwargs["data"]
 
         try:
-            with open(self.log_file, "a") as f:
-                f.write(json.dumps(entry) + "\n")
+            self._buf.append(json.dumps(entry))
         except Exception:
             pass  # Don't let logging errors break the hook
 
+    def flush(self):
+        """Write buffered log entries to the log file."""
+        if not self._buf:
+            return
+        try:
+            f = self._open()
+            f.write("\n".join(self._buf) + "\n")
+            f.flush()
+        except Exception:
+            pass  # Don't let logging errors break the hook
+        self._buf.clear()
+
     def debug(self, message: str, **kwargs):
         self._write("DEBUG", message, **kwargs)
 
@@ -99,3 +136,24 @@ class HookLogger:
     def log_output(self, output: dict):
         """Log the hook output."""
         self.debug("Hook output", data=output)
+
+
+class NullLogger:
+    """Logger with the HookLogger interface that discards everything."""
+
+    def _noop(self, *args, **kwargs):
+        pass
+
+    debug = info = warning = error = log_input = log_output = flush = _noop
+
+
+def logging_enabled() -> bool:
+    """Logging is on unless CLAUDE_HOOK_LOG is set to 0."""
+    return os.environ.get("CLAUDE_HOOK_LOG", "1") != "0"
+
+
+def get_logger(hook_name: str):
+    """Return a HookLogger, or a NullLogger when logging is disabled."""
+    if logging_enabled():
+        return HookLogger(hook_name)
+    return NullLogger()
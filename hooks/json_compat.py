@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+Shared JSON helpers for Claude Code hooks.
+
+Usage:
+    from json_compat import HAS_ORJSON, orjson, json_loads
+    data = json_loads(line)
+    if HAS_ORJSON:
+        raw = orjson.dumps(data)
+
+orjson is optional; without it json_loads is the stdlib json.loads and
+orjson is None.
+"""
+
+import json
+
+# Try to import orjson for faster JSON parsing, fall back to stdlib json
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    HAS_ORJSON = False
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either
+json_loads = orjson.loads if HAS_ORJSON else json.loads
@@ -11,11 +11,8 @@ import json
 import sys
 import os
 
-# Add hooks directory to path for shared modules
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-from hook_logger import HookLogger
-
-logger = HookLogger("large-input-detector")
+# Created on first use so sub-threshold prompts skip the logger entirely
+_logger = None
 
 # Thresholds (characters)
 SUGGEST_RLM_THRESHOLD = 50000      # 50K chars (~12K tokens) - suggest RLM
@@ -24,31 +21,48 @@ STRONG_RLM_THRESHOLD = 150000      # 150K chars (~37K tokens) - strongly recomme
 # Project directory with RLM tools (use cwd from hook input)
 PROJECT_DIR = os.environ.get("CLAUDE_PROJECT_DIR", os.getcwd())
 
+def get_logger():
+    """Import and create the hook logger on first use."""
+    global _logger
+    if _logger is None:
+        # Add hooks directory to path for shared modules
+        sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+        from hook_logger import get_logger as create_logger
+        _logger = create_logger("large-input-detector")
+    return _logger
+
 def estimate_tokens(text):
     """Rough estimate: ~4 chars per token for English text."""
     return len(text) // 4
 
 def main():
-    logger.info("Hook started")
-
     # Read hook input from stdin
     try:
-        hook_input = json.load(sys.stdin)
-        logger.log_input(hook_input)
+        raw = sys.stdin.buffer.read()
+        # The prompt can't be longer than the whole JSON payload, so small
+        # inputs exit without being parsed at all
+        if len(raw) < SUGGEST_RLM_THRESHOLD:
+            sys.exit(0)
+        hook_input = json.loads(raw)
     except json.JSONDecodeError as e:
-        logger.error(f"JSON decode error: {e}", exc_info=True)
+        get_logger().error(f"JSON decode error: {e}", exc_info=True)
         sys.exit(0)
     except Exception as e:
-        logger.error(f"Unexpected error reading input: {e}", exc_info=True)
+        get_logger().error(f"Unexpected error reading input: {e}", exc_info=True)
         sys.exit(0)
 
     # Get the user prompt
     prompt = hook_input.get("prompt", "")
-    if not prompt:
-        logger.debug("No prompt provided, exiting")
+    char_count = len(prompt)
+
+    # Common case: input is fine, exit before touching the logger
+    if char_count < SUGGEST_RLM_THRESHOLD:
         sys.exit(0)
 
-    char_count = len(prompt)
+    logger = get_logger()
+    logger.info("Hook started")
+    logger.log_input(hook_input)
+
     token_estimate = estimate_tokens(prompt)
     logger.debug(f"Input size: {char_count} chars, ~{token_estimate} tokens")
 
@@ -69,7 +83,7 @@ RECOMMENDED: Use RLM (Recursive Language Model) workflow:
 
 This ensures accurate processing of the full document."""
 
-    elif char_count >= SUGGEST_RLM_THRESHOLD:
+    else:
         logger.info(f"Soft RLM suggestion triggered ({char_count} chars)")
         # Soft suggestion
         project_dir = hook_input.get("cwd", PROJECT_DIR)
@@ -80,11 +94,6 @@ Consider using RLM workflow if you need comprehensive analysis:
 - RLM tools available in: {project_dir}/rlm_tools/
 - Run: python rlm_tools/probe.py <file> to analyze structure"""
 
-    else:
-        # Input is fine, no action needed
-        logger.debug("Input size below threshold, no action needed")
-        sys.exit(0)
-
     # Output suggestion
     output = {
         "hookSpecificOutput": {
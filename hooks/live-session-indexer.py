@@ -12,18 +12,20 @@ import json
 import sys
 import os
 import re
-from datetime import datetime
-from pathlib import Path
+from collections import Counter
+from datetime import datetime, timezone
+from functools import lru_cache
 
 # Add hooks directory to path for shared modules
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-from hook_logger import HookLogger
+from session_discovery import find_current_session
+from json_compat import HAS_ORJSON, orjson, json_loads
 
-logger = HookLogger("live-session-indexer")
+# Created on first use so the no-session exit skips the logger entirely
+_logger = None
 
 # Directories
 SESSIONS_DIR = os.path.expanduser("~/.claude/sessions")
-PROJECTS_DIR = os.path.expanduser("~/.claude/projects")
 
 # Segment detection thresholds
 MIN_SEGMENT_LINES = 10      # Minimum lines for a segment
@@ -46,6 +48,36 @@ DOMAIN_KEYWORDS = {
     "backend", "server", "node", "python", "deno", "bun",
 }
 
+# All domain keywords as one alternation (longest first), so content is scanned once
+# (matched against lowercased text)
+_TOPIC_RE = re.compile(
+    r"\b(" + "|".join(sorted(map(re.escape, DOMAIN_KEYWORDS), key=len, reverse=True)) + r")\b"
+)
+
+# Fractional seconds in ISO timestamps
+_FRAC_RE = re.compile(r'\.\d+')
+
+# File paths mentioned in content (quoted or backticked)
+_FILE_PATTERNS = [
+    re.compile(r'["\']([^"\']+\.(py|ts|js|md|json|tsx|jsx))["\']'),
+    re.compile(r'`([^`]+\.(py|ts|js|md|json|tsx|jsx))`'),
+]
+
+# Decision indicators
+_DECISION_PATTERNS = [
+    re.compile(r"(?:I'll|Let's|We should|I've decided|decided to|going to)\s+([^.!?\n]+)", re.IGNORECASE),
+    re.compile(r"(?:approach|strategy|solution):\s*([^.!?\n]+)", re.IGNORECASE),
+]
+
+
+def get_logger():
+    """Import and create the hook logger on first use."""
+    global _logger
+    if _logger is None:
+        from hook_logger import get_logger as create_logger
+        _logger = create_logger("live-session-indexer")
+    return _logger
+
 
 def ensure_dirs(session_id):
     """Create session directory if needed."""
@@ -67,6 +99,7 @@ def load_segment_index(session_dir):
             "project": None,
             "jsonl_file": None,
             "last_indexed_line": 0,
+            "last_indexed_offset": 0,
             "segments": [],
             "active_segment": None
         }
@@ -76,69 +109,30 @@ def save_segment_index(session_dir, index):
     """Save segment index to disk."""
     index_path = os.path.join(session_dir, "segments.json")
     index["last_updated"] = datetime.now().isoformat()
-    with open(index_path, 'w') as f:
-        json.dump(index, f, indent=2)
-
-
-def find_current_session():
-    """Find the most recently modified session file for current project."""
-    if not os.path.exists(PROJECTS_DIR):
-        return None, None
-
-    # Get current working directory to match project
-    cwd = os.getcwd()
-    project_name = cwd.replace("/", "-").replace(" ", "-")
-
-    # Find project directories that might match
-    best_match = None
-    best_time = 0
+    if HAS_ORJSON:
+        data = orjson.dumps(index, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(index, indent=2).encode()
 
-    for project_dir in Path(PROJECTS_DIR).iterdir():
-        if not project_dir.is_dir():
-            continue
-        if project_dir.name.startswith('.'):
-            continue
-
-        # Find most recent JSONL file
-        for jsonl_file in project_dir.glob("*.jsonl"):
-            if "subagents" in str(jsonl_file):
-                continue
-            mtime = jsonl_file.stat().st_mtime
-            if mtime > best_time:
-                best_time = mtime
-                best_match = {
-                    "path": str(jsonl_file),
-                    "project": project_dir.name,
-                    "session_id": jsonl_file.stem
-                }
-
-    return best_match
+    # Write to a temp file and rename, so a crash never leaves a partial index
+    tmp_path = index_path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, index_path)
 
 
+@lru_cache(maxsize=4096)
 def parse_timestamp(ts_str):
-    """Parse ISO timestamp string to datetime."""
+    """Parse ISO timestamp string to a naive UTC datetime."""
     if not ts_str:
         return None
     try:
-        # Handle various ISO formats
-        ts_str = ts_str.replace('Z', '+00:00')
-        if '.' in ts_str:
-            ts_str = ts_str[:ts_str.index('.')] + ts_str[ts_str.index('+'):] if '+' in ts_str else ts_str[:ts_str.index('.')]
-        return datetime.fromisoformat(ts_str.replace('+00:00', ''))
-    except:
+        ts = datetime.fromisoformat(_FRAC_RE.sub('', ts_str.replace('Z', '+00:00')))
+    except (AttributeError, ValueError):
         return None
-
-
-def extract_topics(content):
-    """Extract topics from content."""
-    topics = set()
-    content_lower = content.lower() if content else ""
-
-    for keyword in DOMAIN_KEYWORDS:
-        if keyword in content_lower:
-            topics.add(keyword)
-
-    return topics
+    if ts.tzinfo is not None:
+        ts = ts.astimezone(timezone.utc).replace(tzinfo=None)
+    return ts
 
 
 def extract_files(content):
@@ -147,18 +141,9 @@ def extract_files(content):
     if not content:
         return files
 
-    patterns = [
-        r'["\']([^"\']+\.(py|ts|js|md|json|tsx|jsx))["\']',
-        r'`([^`]+\.(py|ts|js|md|json|tsx|jsx))`',
-    ]
-
-    for pattern in patterns:
-        matches = re.findall(pattern, content)
-        for match in matches:
-            if isinstance(match, tuple):
-                files.add(match[0])
-            else:
-                files.add(match)
+    for pattern in _FILE_PATTERNS:
+        for match in pattern.findall(content):
+            files.add(match[0])
 
     return files
 
@@ -169,21 +154,32 @@ def extract_decisions(content):
     if not content:
         return decisions
 
-    # Look for decision indicators
-    decision_patterns = [
-        r"(?:I'll|Let's|We should|I've decided|decided to|going to)\s+([^.!?\n]+)",
-        r"(?:approach|strategy|solution):\s*([^.!?\n]+)",
-    ]
-
-    for pattern in decision_patterns:
-        matches = re.findall(pattern, content, re.IGNORECASE)
-        for match in matches:
+    for pattern in _DECISION_PATTERNS:
+        for match in pattern.findall(content):
             if len(match) > 10 and len(match) < 200:
                 decisions.append(match.strip())
 
     return decisions[:5]  # Limit to top 5
 
 
+def scan_text(acc, text, files=False, decisions=False):
+    """
+    Scan one text block into a segment's running summary.
+
+    Topics are always collected; file paths and decisions only when asked,
+    since user text, assistant text and tool inputs each feed different fields.
+    """
+    if not text:
+        return
+    acc["topics"].update(_TOPIC_RE.findall(text.lower()))
+    if files:
+        acc["files"].update(extract_files(text))
+    # Only the first 3 decisions are kept
+    if decisions and len(acc["decisions"]) < 3:
+        acc["decisions"].extend(extract_decisions(text))
+        del acc["decisions"][3:]
+
+
 def is_segment_boundary(current_msg, prev_msg, line_count):
     """Determine if this is a segment boundary."""
     # Force boundary if segment too large
@@ -194,7 +190,7 @@ def is_segment_boundary(current_msg, prev_msg, line_count):
     if line_count < MIN_SEGMENT_LINES:
         return False, None
 
-    # Check for time gap
+    # Check for time gap (parse_timestamp is cached, so prev_ts is a cache hit)
     curr_ts = parse_timestamp(current_msg.get("timestamp"))
     prev_ts = parse_timestamp(prev_msg.get("timestamp")) if prev_msg else None
 
@@ -203,22 +199,22 @@ def is_segment_boundary(current_msg, prev_msg, line_count):
         if gap > TIME_GAP_MINUTES:
             return True, "time_gap"
 
+    msg_type = current_msg.get("type")
+
     # Check for TodoWrite with completed tasks (task completion boundary)
-    if current_msg.get("type") == "assistant":
+    if msg_type == "assistant":
         content_list = current_msg.get("message", {}).get("content", [])
         if isinstance(content_list, list):
             for item in content_list:
-                if isinstance(item, dict) and item.get("type") == "tool_use":
-                    if item.get("name") == "TodoWrite":
-                        tool_input = item.get("input", {})
-                        todos = tool_input.get("todos", [])
-                        # Check if any todos are being marked completed
-                        for todo in todos:
-                            if todo.get("status") == "completed":
-                                return True, "task_completed"
+                if (isinstance(item, dict) and item.get("type") == "tool_use"
+                        and item.get("name") == "TodoWrite"):
+                    todos = item.get("input", {}).get("todos", [])
+                    # Check if any todos are being marked completed
+                    if any(todo.get("status") == "completed" for todo in todos):
+                        return True, "task_completed"
 
     # Check for new user message after assistant (natural turn boundary)
-    if current_msg.get("type") == "user" and prev_msg and prev_msg.get("type") == "assistant":
+    elif msg_type == "user" and prev_msg and prev_msg.get("type") == "assistant":
         # Check if topic changed significantly
         curr_content = current_msg.get("message", {}).get("content", "")
         if isinstance(curr_content, str) and len(curr_content) > 50:
@@ -227,39 +223,77 @@ def is_segment_boundary(current_msg, prev_msg, line_count):
     return False, None
 
 
-def create_segment_summary(messages):
-    """Create a brief summary of the segment."""
-    topics = set()
-    files = set()
-    tools = {}
-    decisions = []
+def new_segment_acc():
+    """Create an empty running summary for a segment."""
+    return {
+        "topics": set(),
+        "files": set(),
+        "tools": Counter(),
+        "decisions": [],
+        "first_timestamp": None
+    }
 
-    for msg in messages:
-        msg_type = msg.get("type")
-
-        if msg_type == "user":
-            content = msg.get("message", {}).get("content", "")
-            if isinstance(content, str):
-                topics.update(extract_topics(content))
-                files.update(extract_files(content))
-
-        elif msg_type == "assistant":
-            content_list = msg.get("message", {}).get("content", [])
-            if isinstance(content_list, list):
-                for item in content_list:
-                    if isinstance(item, dict):
-                        if item.get("type") == "text":
-                            text = item.get("text", "")
-                            topics.update(extract_topics(text))
-                            decisions.extend(extract_decisions(text))
-                        elif item.get("type") == "tool_use":
-                            tool_name = item.get("name", "unknown")
-                            tools[tool_name] = tools.get(tool_name, 0) + 1
-                            tool_input = item.get("input", {})
-                            if isinstance(tool_input, dict):
-                                for val in tool_input.values():
-                                    if isinstance(val, str):
-                                        files.update(extract_files(val))
+
+def update_segment_acc(acc, msg):
+    """Fold one message into a segment's running summary."""
+    if acc["first_timestamp"] is None:
+        acc["first_timestamp"] = msg.get("timestamp")
+
+    msg_type = msg.get("type")
+
+    if msg_type == "user":
+        content = msg.get("message", {}).get("content", "")
+        if isinstance(content, str):
+            scan_text(acc, content, files=True)
+
+    elif msg_type == "assistant":
+        content_list = msg.get("message", {}).get("content", [])
+        if isinstance(content_list, list):
+            for item in content_list:
+                if isinstance(item, dict):
+                    if item.get("type") == "text":
+                        scan_text(acc, item.get("text", ""), decisions=True)
+                    elif item.get("type") == "tool_use":
+                        acc["tools"][item.get("name", "unknown")] += 1
+                        tool_input = item.get("input", {})
+                        if isinstance(tool_input, dict):
+                            for val in tool_input.values():
+                                if isinstance(val, str):
+                                    acc["files"].update(extract_files(val))
+
+
+def dump_segment_acc(acc):
+    """Convert a running summary to JSON-serializable form."""
+    return {
+        "topics": list(acc["topics"]),
+        "files": list(acc["files"]),
+        "tools": dict(acc["tools"]),
+        "decisions": acc["decisions"],
+        "first_timestamp": acc["first_timestamp"]
+    }
+
+
+def load_segment_acc(data):
+    """Restore a running summary saved by dump_segment_acc."""
+    if not data:
+        return new_segment_acc()
+    return {
+        "topics": set(data.get("topics", [])),
+        "files": set(data.get("files", [])),
+        "tools": Counter(data.get("tools", {})),
+        "decisions": data.get("decisions", []),
+        "first_timestamp": data.get("first_timestamp")
+    }
+
+
+def create_segment_summary(acc):
+    """Create a brief summary of the segment from its running summary."""
+    topics = acc["topics"]
+    files = acc["files"]
+    tools = acc["tools"]
+
+    # Top 5 tools by count (Counter.most_common uses heapq.nlargest)
+    top_tools = tools.most_common(5)
 
     # Build summary string
     summary_parts = []
@@ -268,137 +302,181 @@ def create_segment_summary(messages):
     if files:
         summary_parts.append(f"Files: {len(files)}")
     if tools:
-        top_tools = sorted(tools.items(), key=lambda x: x[1], reverse=True)[:3]
-        summary_parts.append(f"Tools: {', '.join([t[0] for t in top_tools])}")
+        summary_parts.append(f"Tools: {', '.join([t[0] for t in top_tools[:3]])}")
 
     return {
         "topics": list(topics)[:10],
         "files_touched": list(files)[:10],
-        "tools_used": dict(sorted(tools.items(), key=lambda x: x[1], reverse=True)[:5]),
-        "decisions": decisions[:3],
+        "tools_used": dict(top_tools),
+        "decisions": acc["decisions"][:3],
         "summary": " | ".join(summary_parts) if summary_parts else "General discussion"
     }
 
 
 def index_session(session_info, existing_index):
-    """Index new content in the session file."""
+    """
+    Index new content in the session file.
+
+    The file is streamed from the byte offset where the previous run stopped
+    (last_indexed_offset), so only appended lines are read. Each segment
+    records the byte range of its lines for session-recovery.
+
+    If the file size matches last_size from the previous run, nothing was
+    appended and the index is returned untouched after a single stat.
+    """
     path = session_info["path"]
     session_id = session_info["session_id"]
 
     try:
-        with open(path, 'r') as f:
-            lines = f.readlines()
-    except (FileNotFoundError, IOError):
+        size = os.stat(path).st_size
+    except OSError:
         return existing_index
+    if size == existing_index.get("last_size"):
+        return existing_index  # Nothing appended since the last run
 
     # Start from where we left off
     start_line = existing_index.get("last_indexed_line", 0)
-    if start_line >= len(lines):
-        return existing_index  # Already up to date
-
-    # Update index metadata
-    existing_index["session_id"] = session_id
-    existing_index["project"] = session_info["project"]
-    existing_index["jsonl_file"] = path
-
-    # Get existing segments and active segment
-    segments = existing_index.get("segments", [])
-    active_segment = existing_index.get("active_segment")
-
-    if active_segment is None:
-        active_segment = {
-            "segment_id": f"seg-{len(segments):03d}",
-            "start_line": start_line,
-            "messages": [],
-            "line_count": 0
-        }
-
-    # Process new lines
-    prev_msg = None
-    for i in range(start_line, len(lines)):
-        line = lines[i].strip()
-        if not line:
-            continue
-
-        try:
-            msg = json.loads(line)
-        except json.JSONDecodeError:
-            continue
-
-        # Skip file snapshots and summaries
-        if msg.get("type") in ["file-history-snapshot", "summary"]:
-            continue
-
-        # Check for segment boundary
-        is_boundary, boundary_type = is_segment_boundary(msg, prev_msg, active_segment["line_count"])
-
-        if is_boundary and active_segment["messages"]:
-            # Finalize current segment
-            segment_data = create_segment_summary(active_segment["messages"])
-            segment_entry = {
-                "segment_id": active_segment["segment_id"],
-                "start_line": active_segment["start_line"],
-                "end_line": i - 1,
-                "line_count": active_segment["line_count"],
-                "boundary_type": boundary_type,
-                **segment_data
-            }
+    start_offset = existing_index.get("last_indexed_offset")
 
-            # Get timestamp from first message
-            first_msg = active_segment["messages"][0]
-            segment_entry["timestamp"] = first_msg.get("timestamp", datetime.now().isoformat())
-
-            segments.append(segment_entry)
+    try:
+        f = open(path, 'rb', buffering=1 << 20)
+    except (FileNotFoundError, IOError):
+        return existing_index
 
-            # Start new segment
+    with f:
+        if start_offset is not None:
+            f.seek(start_offset)
+        else:
+            # Index written before offsets were stored: skip already indexed lines
+            start_offset = 0
+            for _ in range(start_line):
+                line = f.readline()
+                if not line.endswith(b"\n"):
+                    return existing_index  # File shorter than the index says
+                start_offset += len(line)
+
+        # Update index metadata
+        existing_index["session_id"] = session_id
+        existing_index["project"] = session_info["project"]
+        existing_index["jsonl_file"] = path
+
+        # Get existing segments and active segment
+        segments = existing_index.get("segments", [])
+        active_segment = existing_index.get("active_segment")
+
+        if active_segment is None:
             active_segment = {
                 "segment_id": f"seg-{len(segments):03d}",
-                "start_line": i,
-                "messages": [],
+                "start_line": start_line,
+                "start_offset": start_offset,
                 "line_count": 0
             }
+        acc = load_segment_acc(active_segment.get("acc"))
+
+        # Process new lines
+        i = start_line
+        offset = start_offset
+        prev_msg = None
+        for raw in f:
+            # Stop at a partially written last line, it gets picked up next time
+            if not raw.endswith(b"\n"):
+                break
+            line_offset = offset
+            offset += len(raw)
+            i += 1
+
+            # Messages are JSON objects; skip blank or junk lines without a decode attempt
+            line = raw.strip()
+            if not line.startswith(b"{"):
+                continue
+
+            try:
+                msg = json_loads(line)
+            except json.JSONDecodeError:
+                continue
+
+            # Skip file snapshots and summaries
+            if msg.get("type") in ["file-history-snapshot", "summary"]:
+                continue
 
-        # Add message to active segment
-        active_segment["messages"].append(msg)
-        active_segment["line_count"] += 1
-        prev_msg = msg
+            # Check for segment boundary
+            is_boundary, boundary_type = is_segment_boundary(msg, prev_msg, active_segment["line_count"])
+
+            if is_boundary and active_segment["line_count"]:
+                # Finalize current segment
+                segment_data = create_segment_summary(acc)
+                segment_entry = {
+                    "segment_id": active_segment["segment_id"],
+                    "start_line": active_segment["start_line"],
+                    "end_line": i - 2,
+                    "start_offset": active_segment.get("start_offset"),
+                    "end_offset": line_offset,
+                    "line_count": active_segment["line_count"],
+                    "boundary_type": boundary_type,
+                    **segment_data
+                }
+
+                # Get timestamp from first message
+                segment_entry["timestamp"] = acc["first_timestamp"] or datetime.now().isoformat()
+
+                segments.append(segment_entry)
+
+                # Start new segment
+                active_segment = {
+                    "segment_id": f"seg-{len(segments):03d}",
+                    "start_line": i - 1,
+                    "start_offset": line_offset,
+                    "line_count": 0
+                }
+                acc = new_segment_acc()
+
+            # Add message to active segment
+            update_segment_acc(acc, msg)
+            active_segment["line_count"] += 1
+            prev_msg = msg
 
     # Update index
     existing_index["segments"] = segments
     existing_index["active_segment"] = {
         "segment_id": active_segment["segment_id"],
         "start_line": active_segment["start_line"],
-        "line_count": active_segment["line_count"]
+        "start_offset": active_segment.get("start_offset"),
+        "line_count": active_segment["line_count"],
+        "acc": dump_segment_acc(acc)
     }
-    existing_index["last_indexed_line"] = len(lines)
+    existing_index["last_indexed_line"] = i
+    existing_index["last_indexed_offset"] = offset
+    existing_index["last_size"] = size
     existing_index["total_segments"] = len(segments)
 
     return existing_index
 
 
 def main():
-    logger.info("Hook started")
-
     # Read hook input from stdin
     try:
         hook_input = json.load(sys.stdin)
     except json.JSONDecodeError as e:
-        logger.error(f"JSON decode error: {e}", exc_info=True)
+        get_logger().error(f"JSON decode error: {e}", exc_info=True)
         sys.exit(0)
     except Exception as e:
-        logger.error(f"Unexpected error reading input: {e}", exc_info=True)
+        get_logger().error(f"Unexpected error reading input: {e}", exc_info=True)
         sys.exit(0)
 
     # Find current session
     try:
         session_info = find_current_session()
-        if not session_info:
-            logger.debug("No current session found, exiting")
-            sys.exit(0)
     except Exception as e:
-        logger.error(f"Error finding current session: {e}", exc_info=True)
+        get_logger().error(f"Error finding current session: {e}", exc_info=True)
+        sys.exit(0)
+
+    # Common no-op case: exit before touching the logger
+    if not session_info:
         sys.exit(0)
 
+    logger = get_logger()
+    logger.info("Hook started")
+
     session_id = session_info["session_id"]
     logger.debug(f"Processing session: {session_id}")
 
@@ -408,6 +486,7 @@ def main():
     # Load existing index
     existing_index = load_segment_index(session_dir)
     existing_segments = len(existing_index.get("segments", []))
+    last_size = existing_index.get("last_size")
     logger.debug(f"Loaded existing index with {existing_segments} segments")
 
     # Index new content
@@ -419,6 +498,11 @@ def main():
         logger.error(f"Error indexing session: {e}", exc_info=True)
         sys.exit(0)
 
+    # Nothing new was indexed, so the saved index is still current
+    if updated_index.get("last_size") == last_size:
+        logger.info("Hook completed (no new content)")
+        sys.exit(0)
+
     # Save updated index
     try:
         save_segment_index(session_dir, updated_index)
@@ -16,12 +16,17 @@ import json
 import sys
 import os
 import re
+import heapq
+import io
 from datetime import datetime, timedelta
-from pathlib import Path
+from functools import lru_cache
+from itertools import islice
 
 # Add hooks directory to path for shared modules
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from hook_logger import HookLogger
+from session_discovery import find_current_session
+from json_compat import json_loads
 
 logger = HookLogger("session-recovery")
 
@@ -30,7 +35,6 @@ PROJECT_DIR = os.environ.get("CLAUDE_PROJECT_DIR", os.getcwd())
 
 # Directories
 SESSIONS_DIR = os.path.expanduser("~/.claude/sessions")
-PROJECTS_DIR = os.path.expanduser("~/.claude/projects")
 
 # Persistence files
 PERSISTENCE_FILES = [
@@ -39,50 +43,47 @@ PERSISTENCE_FILES = [
     ("insights.md", "Accumulated Learnings"),
 ]
 
-# Context budget for segments (characters)
-SEGMENT_CONTEXT_BUDGET = 8000  # ~2000 tokens worth of actual conversation
+# "## In Progress" / "## Pending" sections of todos.md, up to the next "## " heading
+_PENDING_SECTION_RE = re.compile(
+    r'^[^\n]*## (?:In Progress|Pending)[^\n]*\n(.*?)(?=^## |\Z)', re.MULTILINE | re.DOTALL
+)
 
+# Unchecked todo items
+_TODO_ITEM_RE = re.compile(r'^[ \t]*- \[ \]([^\n]*)', re.MULTILINE)
 
-def read_file_safe(filepath):
-    """Read file contents, return empty string if not found."""
-    try:
-        with open(filepath, 'r') as f:
-            return f.read()
-    except (FileNotFoundError, IOError):
-        return ""
+# Max characters of each persistence file to include
+PERSISTENCE_FILE_LIMIT = 2500
 
+# Context budget for segments (characters)
+SEGMENT_CONTEXT_BUDGET = 8000  # ~2000 tokens worth of actual conversation
 
-def find_current_session():
-    """Find the most recently modified session for current project."""
-    if not os.path.exists(PROJECTS_DIR):
-        return None
+# Max segments considered for content extraction
+MAX_CANDIDATE_SEGMENTS = 16
 
-    best_match = None
-    best_time = 0
 
-    for project_dir in Path(PROJECTS_DIR).iterdir():
-        if not project_dir.is_dir():
-            continue
-        if project_dir.name.startswith('.'):
-            continue
+@lru_cache(maxsize=None)
+def _read_file_cached(filepath, mtime_ns, limit):
+    """Read file contents; mtime_ns is only part of the cache key."""
+    with open(filepath, 'r') as f:
+        return f.read(limit)
 
-        for jsonl_file in project_dir.glob("*.jsonl"):
-            if "subagents" in str(jsonl_file):
-                continue
-            mtime = jsonl_file.stat().st_mtime
-            if mtime > best_time:
-                best_time = mtime
-                best_match = {
-                    "path": str(jsonl_file),
-                    "project": project_dir.name,
-                    "session_id": jsonl_file.stem
-                }
 
-    return best_match
+def read_file_safe(filepath, limit=None):
+    """
+    Read file contents, return empty string if not found.
+
+    With a limit, at most that many characters are read from the start.
+    """
+    try:
+        # Keyed on mtime so a changed file is re-read
+        return _read_file_cached(filepath, os.stat(filepath).st_mtime_ns, limit)
+    except (FileNotFoundError, IOError):
+        return ""
 
 
+@lru_cache(maxsize=None)
 def load_segment_index(session_id):
-    """Load segment index for a session."""
+    """Load segment index for a session (cached per process, read-only)."""
     index_path = os.path.join(SESSIONS_DIR, session_id, "segments.json")
     try:
         with open(index_path, 'r') as f:
@@ -94,25 +95,23 @@ def load_segment_index(session_id):
 def extract_pending_todos(todos_content):
     """Extract pending todos from todos.md content."""
     pending = []
-    in_pending = False
 
-    for line in todos_content.split('\n'):
-        if '## In Progress' in line or '## Pending' in line:
-            in_pending = True
-            continue
-        if in_pending and line.startswith('## '):
-            in_pending = False
-        if in_pending and line.strip().startswith('- [ ]'):
-            # Extract todo text
-            todo_text = line.replace('- [ ]', '').strip()
+    for section in _PENDING_SECTION_RE.finditer(todos_content):
+        for todo_text in _TODO_ITEM_RE.findall(section.group(1)):
+            todo_text = todo_text.strip()
             if todo_text:
                 pending.append(todo_text.lower())
 
     return pending
 
 
-def score_segment(segment, pending_todos, now):
-    """Score a segment for relevance."""
+def score_segment(segment, pending_word_sets, now):
+    """
+    Score a segment for relevance.
+
+    pending_word_sets holds the word set of each pending todo, split once by
+    the caller. Segment topics are stored lowercase by live-session-indexer.
+    """
     score = 0
 
     # Recency score (exponential decay, max 50 points)
@@ -128,11 +127,10 @@ def score_segment(segment, pending_todos, now):
         pass
 
     # Topic match with pending todos (max 30 points)
-    topics = set(t.lower() for t in segment.get("topics", []))
-    for todo in pending_todos:
-        todo_words = set(todo.split())
-        matching_topics = topics.intersection(todo_words)
-        score += len(matching_topics) * 10
+    if pending_word_sets:
+        topics = set(segment.get("topics", []))
+        for todo_words in pending_word_sets:
+            score += len(topics & todo_words) * 10
 
     # Has uncommitted decisions (10 points)
     if segment.get("decisions"):
@@ -155,26 +153,40 @@ def score_segment(segment, pending_todos, now):
     return score
 
 
-def extract_segment_content(jsonl_path, start_line, end_line):
-    """Extract actual conversation content from JSONL for a segment."""
-    content_parts = []
-
-    try:
-        with open(jsonl_path, 'r') as f:
-            lines = f.readlines()
-    except (FileNotFoundError, IOError):
-        return ""
+def read_segment_messages(f, segment):
+    """
+    Read and parse the JSONL messages of a segment from an open session file.
 
-    for i in range(start_line, min(end_line + 1, len(lines))):
-        line = lines[i].strip()
-        if not line:
+    Segments indexed with byte offsets are read with a single seek + read;
+    older segments fall back to streaming up to end_line.
+    """
+    start_offset = segment.get("start_offset")
+    end_offset = segment.get("end_offset")
+    if start_offset is not None and end_offset is not None:
+        f.seek(start_offset)
+        lines = f.read(end_offset - start_offset).splitlines()
+    else:
+        f.seek(0)
+        lines = islice(f, segment.get("start_line", 0), segment.get("end_line", 0) + 1)
+
+    messages = []
+    for line in lines:
+        # Messages are JSON objects; skip blank or junk lines without a decode attempt
+        line = line.strip()
+        if not line.startswith(b"{"):
             continue
-
         try:
-            msg = json.loads(line)
+            messages.append(json_loads(line))
         except json.JSONDecodeError:
             continue
+    return messages
 
+
+def format_segment_content(messages):
+    """Format a segment's conversation messages as a readable excerpt."""
+    content_parts = []
+
+    for msg in messages:
         msg_type = msg.get("type")
 
         if msg_type == "user":
@@ -216,57 +228,66 @@ def select_best_segments(segments, pending_todos, jsonl_path, budget):
         return []
 
     now = datetime.now()
+    pending_word_sets = [set(todo.split()) for todo in pending_todos]
 
-    # Score all segments
-    scored = []
-    for seg in segments:
-        score = score_segment(seg, pending_todos, now)
-        scored.append((score, seg))
-
-    # Sort by score (highest first)
-    scored.sort(key=lambda x: x[0], reverse=True)
+    # Score all segments, keeping only the best candidates (highest first)
+    # so low scorers never reach content extraction
+    scored = heapq.nlargest(
+        MAX_CANDIDATE_SEGMENTS,
+        ((score_segment(seg, pending_word_sets, now), seg) for seg in segments),
+        key=lambda x: x[0]
+    )
 
     # Select segments within budget
     selected = []
     total_chars = 0
 
-    for score, seg in scored:
-        # Estimate content size
-        line_count = seg.get("line_count", 0)
-        estimated_chars = line_count * 100  # Rough estimate
+    # Open the session file once for all selected segments
+    try:
+        f = open(jsonl_path, 'rb')
+    except (FileNotFoundError, IOError):
+        return []
 
-        if total_chars + estimated_chars > budget:
-            continue
+    with f:
+        for score, seg in scored:
+            # Estimate content size
+            line_count = seg.get("line_count", 0)
+            estimated_chars = line_count * 100  # Rough estimate
+
+            if total_chars + estimated_chars > budget:
+                continue
 
-        # Extract actual content
-        content = extract_segment_content(
-            jsonl_path,
-            seg.get("start_line", 0),
-            seg.get("end_line", 0)
-        )
-
-        if content:
-            total_chars += len(content)
-            selected.append({
-                "segment_id": seg.get("segment_id"),
-                "score": score,
-                "topics": seg.get("topics", []),
-                "summary": seg.get("summary", ""),
-                "content": content
-            })
-
-        if total_chars >= budget:
-            break
+            # Extract actual content
+            content = format_segment_content(read_segment_messages(f, seg))
+
+            if content:
+                total_chars += len(content)
+                selected.append({
+                    "segment_id": seg.get("segment_id"),
+                    "score": score,
+                    "topics": seg.get("topics", []),
+                    "summary": seg.get("summary", ""),
+                    "content": content
+                })
+
+            if total_chars >= budget:
+                break
 
     return selected
 
 
 def build_recovery_context():
     """Build the complete recovery context."""
-    sections = []
-    sections.append("=" * 70)
-    sections.append("SESSION RECOVERED - RLM-based intelligent context loading")
-    sections.append("=" * 70)
+    # Lines are written straight into one buffer, newline-separated
+    buf = io.StringIO()
+    buf.write("=" * 70)
+
+    def add(text):
+        buf.write("\n")
+        buf.write(text)
+
+    add("SESSION RECOVERED - RLM-based intelligent context loading")
+    add("=" * 70)
 
     # Part 1: Load persistence files
     files_found = 0
@@ -274,15 +295,16 @@ def build_recovery_context():
 
     for filename, description in PERSISTENCE_FILES:
         filepath = os.path.join(PROJECT_DIR, filename)
-        content = read_file_safe(filepath)
+        # One char past the cutoff is enough to know whether to truncate
+        content = read_file_safe(filepath, limit=PERSISTENCE_FILE_LIMIT + 1)
 
         if content.strip():
             files_found += 1
-            sections.append(f"\n### {description} ({filename})\n")
+            add(f"\n### {description} ({filename})\n")
             # Keep full content for small files, truncate large ones
-            if len(content) > 2500:
-                content = content[:2500] + "\n... [truncated]"
-            sections.append(content)
+            if len(content) > PERSISTENCE_FILE_LIMIT:
+                content = content[:PERSISTENCE_FILE_LIMIT] + "\n... [truncated]"
+            add(content)
 
             if filename == "todos.md":
                 todos_content = content
@@ -306,29 +328,29 @@ def build_recovery_context():
             )
 
             if selected_segments:
-                sections.append("\n" + "=" * 70)
-                sections.append("RELEVANT CONVERSATION CONTEXT (RLM-recovered)")
-                sections.append("=" * 70)
+                add("\n" + "=" * 70)
+                add("RELEVANT CONVERSATION CONTEXT (RLM-recovered)")
+                add("=" * 70)
 
                 for seg in selected_segments:
-                    sections.append(f"\n--- Segment {seg['segment_id']} (score: {seg['score']:.0f}) ---")
-                    sections.append(f"Topics: {', '.join(seg['topics'][:5])}")
-                    sections.append(f"Summary: {seg['summary']}")
-                    sections.append("\nConversation excerpt:")
-                    sections.append(seg['content'])
+                    add(f"\n--- Segment {seg['segment_id']} (score: {seg['score']:.0f}) ---")
+                    add(f"Topics: {', '.join(seg['topics'][:5])}")
+                    add(f"Summary: {seg['summary']}")
+                    add("\nConversation excerpt:")
+                    add(seg['content'])
 
-                sections.append(f"\n[Loaded {len(selected_segments)} relevant segments from session history]")
+                add(f"\n[Loaded {len(selected_segments)} relevant segments from session history]")
 
     # Final instructions
     if files_found > 0:
-        sections.append("\n" + "=" * 70)
-        sections.append("Continue where you left off. Context has been intelligently restored.")
-        sections.append("Update persistence files (context.md, todos.md, insights.md) as you work.")
-        sections.append("=" * 70)
+        add("\n" + "=" * 70)
+        add("Continue where you left off. Context has been intelligently restored.")
+        add("Update persistence files (context.md, todos.md, insights.md) as you work.")
+        add("=" * 70)
     else:
-        sections.append("\nNo persistence files found. This may be a fresh session.")
+        add("\nNo persistence files found. This may be a fresh session.")
 
-    return "\n".join(sections)
+    return buf.getvalue()
 
 
 def main():
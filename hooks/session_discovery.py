@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Shared session discovery for Claude Code hooks.
+
+Usage:
+    from session_discovery import find_current_session
+    session_info = find_current_session()
+    if session_info:
+        path = session_info["path"]
+
+All lookups use os.scandir and plain str paths (no pathlib objects).
+"""
+
+import os
+from functools import lru_cache
+
+# Claude Code session transcripts, one directory per project
+PROJECTS_DIR = os.path.expanduser("~/.claude/projects")
+
+
+def scan_session_files(projects_dir=PROJECTS_DIR):
+    """
+    Yield (file_entry, project_name) for every session JSONL file.
+
+    Uses os.scandir so directory type checks come from readdir and callers
+    can take stat info from the DirEntry (stat'ed at most once per file).
+    Hidden project directories and subagent transcripts are skipped.
+    """
+    try:
+        projects = os.scandir(projects_dir)
+    except (FileNotFoundError, NotADirectoryError):
+        return
+
+    with projects:
+        for project_entry in projects:
+            if project_entry.name.startswith('.'):
+                continue
+            if not project_entry.is_dir(follow_symlinks=False):
+                continue
+
+            with os.scandir(project_entry.path) as files:
+                for file_entry in files:
+                    if not file_entry.name.endswith(".jsonl"):
+                        continue
+                    if "subagents" in file_entry.path:
+                        continue
+                    yield file_entry, project_entry.name
+
+
+def session_info_from_entry(file_entry, project_name):
+    """Build the session info dict used by the hooks from a DirEntry."""
+    return {
+        "path": file_entry.path,
+        "project": project_name,
+        "session_id": file_entry.name[:-len(".jsonl")]
+    }
+
+
+@lru_cache(maxsize=1)
+def find_current_session(projects_dir=PROJECTS_DIR):
+    """
+    Find the most recently modified session file across all projects.
+
+    Returns a dict with "path", "project" and "session_id", or None.
+    The result is cached for the rest of the hook process; treat it as read-only.
+    """
+    best_match = None
+    best_time = 0
+
+    for file_entry, project_name in scan_session_files(projects_dir):
+        mtime = file_entry.stat().st_mtime
+        if mtime > best_time:
+            best_time = mtime
+            best_match = (file_entry, project_name)
+
+    if best_match is None:
+        return None
+    return session_info_from_entry(*best_match)
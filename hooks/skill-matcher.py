@@ -10,149 +10,283 @@ Output: Matching skills injected as additionalContext
 import json
 import sys
 import os
+import heapq
+import mmap
+import pickle
+import re
+from collections import defaultdict
 from datetime import datetime, timedelta
 
 # Add hooks directory to path for shared modules
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-from hook_logger import HookLogger
+from hook_logger import get_logger
+from skill_journal import SKILL_INDEX_PATH, journal_size, compact_journal
 
-logger = HookLogger("skill-matcher")
+logger = get_logger("skill-matcher")
 
-# Skill index location
-SKILL_INDEX_PATH = os.path.expanduser("~/.claude/skills/skill-index/index.json")
+# Try to import orjson for faster JSON parsing, fall back to stdlib json
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
-def load_skill_index():
-    """Load the skill index from disk."""
+# Pre-digested index (skills + scoring postings), rebuilt when index.json changes
+INDEX_CACHE_PATH = SKILL_INDEX_PATH + ".cache.pkl"
+
+# Bump whenever the cached postings/phrases layout or the tokenization changes,
+# so caches written by older code are rebuilt
+CACHE_VERSION = 2
+
+# Prompt words are the word runs left after "-" and "_" become spaces, so
+# trailing punctuation ("sqlite.") does not stick to a word
+_TOKEN_TRANS = str.maketrans("-_", "  ")
+_WORD_RE = re.compile(r"\w+")
+
+# Terms that are one such word can be looked up in postings; anything else
+# (dashes, spaces, "_", punctuation) is matched as a substring of the prompt
+_SINGLE_WORD_RE = re.compile(r"[^\W_]+")
+
+# Summary words that never count towards a match
+COMMON_WORDS = frozenset({"a", "an", "the", "with", "and", "or", "for", "to", "in", "on", "by", "is", "are"})
+
+def read_skill_index():
+    """
+    Read and parse index.json.
+
+    With orjson the file is memory-mapped and parsed in place, without
+    first copying it into a bytes object.
+    """
     try:
-        with open(SKILL_INDEX_PATH, 'r') as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
+        with open(SKILL_INDEX_PATH, 'rb') as f:
+            if not HAS_ORJSON:
+                return json.loads(f.read())
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # The view must be released before the map is closed
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+    except (FileNotFoundError, ValueError):
+        # ValueError covers JSONDecodeError and mapping an empty file
         return {"skills": []}
 
-def score_skill(skill, prompt_lower, prompt_words):
+def build_postings(skills):
     """
-    Score a skill against the user prompt.
+    Invert the skill index into scoring postings.
 
-    Scoring:
+    Returns (postings, phrases):
+    - postings: prompt word -> ((skill_idx, weight), ...)
+    - phrases: multi-word/dashed tag or category -> ((skill_idx, weight), ...),
+      matched as substrings of the prompt
+
+    Weights for the same term and skill are summed here, so scoring adds
+    one entry per skill a prompt word hits.
+
+    Weights:
     - Exact tag match: +3 per tag
-    - Category word in prompt: +5
+    - Category in prompt: +5
     - Summary word match: +2 per word
-    - Tag word in prompt: +2 per tag
-    - Recent use (< 7 days): +1
+    - Tag word in prompt: +2 per tag word
+    - Skill name part: +3 per part
+    """
+    postings = defaultdict(lambda: defaultdict(int))
+    phrases = defaultdict(lambda: defaultdict(int))
+
+    def add_term(term, skill_idx, weight):
+        # Only terms the prompt tokenizer could produce as one word are
+        # looked up directly
+        if _SINGLE_WORD_RE.fullmatch(term):
+            postings[term][skill_idx] += weight
+        elif term:
+            phrases[term][skill_idx] += weight
+
+    for skill_idx, skill in enumerate(skills):
+        for tag in skill.get("tags", []):
+            tag = tag.lower()
+            add_term(tag, skill_idx, 3)
+            for tag_word in tag.split("-"):
+                if len(tag_word) > 2:
+                    postings[tag_word][skill_idx] += 2
+
+        add_term(skill.get("category", "").lower(), skill_idx, 5)
+
+        summary_words = set(skill.get("summary", "").lower().split())
+        for word in summary_words - COMMON_WORDS:
+            postings[word][skill_idx] += 2
+
+        name = skill.get("name", "").lower()
+        for part in name.replace("-", " ").split():
+            if len(part) > 2:
+                postings[part][skill_idx] += 3
+
+    def freeze(terms):
+        return {term: tuple(weights.items()) for term, weights in terms.items()}
+
+    return freeze(postings), freeze(phrases)
+
+def load_skill_index():
+    """
+    Load the skills and their scoring postings.
+
+    index.json is parsed and inverted only when its mtime differs from the
+    one the pickle cache was built from, or the cache was written with a
+    different CACHE_VERSION; otherwise the cache is loaded as is.
+    Cached skills keep just the fields used after scoring. Skill uses
+    journaled by skill-tracker are folded into index.json first.
     """
-    score = 0
-
-    # Check tags
-    tags = [t.lower() for t in skill.get("tags", [])]
-    for tag in tags:
-        if tag in prompt_lower:
-            score += 3  # Exact tag match
-        # Check if any word in multi-word tags matches
-        for tag_word in tag.split("-"):
-            if tag_word in prompt_words and len(tag_word) > 2:
-                score += 2
-
-    # Check category
-    category = skill.get("category", "").lower()
-    if category in prompt_lower:
-        score += 5
-
-    # Check summary keywords
-    summary = skill.get("summary", "").lower()
-    summary_words = set(summary.split())
-    matching_summary_words = prompt_words & summary_words
-    # Filter out common words
-    common_words = {"a", "an", "the", "with", "and", "or", "for", "to", "in", "on", "by", "is", "are"}
-    meaningful_matches = matching_summary_words - common_words
-    score += len(meaningful_matches) * 2
-
-    # Check skill name
-    name = skill.get("name", "").lower()
-    name_parts = name.replace("-", " ").split()
-    for part in name_parts:
-        if part in prompt_words and len(part) > 2:
-            score += 3
-
-    # Recent use bonus
-    last_used = skill.get("lastUsed")
-    if last_used:
+    if journal_size():
         try:
-            last_used_date = datetime.strptime(last_used, "%Y-%m-%d")
-            if datetime.now() - last_used_date < timedelta(days=7):
-                score += 1
-        except ValueError:
-            pass
+            compact_journal()
+        except OSError as e:
+            logger.warning(f"Could not compact skill journal: {e}")
 
-    return score
+    try:
+        index_mtime = os.stat(SKILL_INDEX_PATH).st_mtime_ns
+    except OSError:
+        return {"skills": [], "postings": {}, "phrases": {}}
 
-def main():
-    logger.info("Hook started")
+    try:
+        with open(INDEX_CACHE_PATH, 'rb') as f:
+            cache = pickle.load(f)
+        if cache.get("version") == CACHE_VERSION and cache.get("index_mtime") == index_mtime:
+            return cache
+    except Exception:
+        pass  # Missing, stale format or unreadable cache, rebuild below
+
+    skills = read_skill_index().get("skills", [])
+    postings, phrases = build_postings(skills)
+    cache = {
+        "version": CACHE_VERSION,
+        "index_mtime": index_mtime,
+        "skills": [
+            {
+                "name": skill.get("name", "unknown"),
+                "summary": skill.get("summary", ""),
+                "lastUsed": skill.get("lastUsed"),
+            }
+            for skill in skills
+        ],
+        "postings": postings,
+        "phrases": phrases,
+    }
 
-    # Read hook input from stdin
     try:
-        hook_input = json.load(sys.stdin)
-        logger.log_input(hook_input)
-    except json.JSONDecodeError as e:
-        logger.error(f"JSON decode error: {e}", exc_info=True)
-        sys.exit(0)
-    except Exception as e:
-        logger.error(f"Unexpected error reading input: {e}", exc_info=True)
-        sys.exit(0)
+        tmp_path = INDEX_CACHE_PATH + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, INDEX_CACHE_PATH)
+    except OSError as e:
+        logger.warning(f"Could not save skill index cache: {e}")
+
+    return cache
+
+def score_skills(skills, postings, phrases, prompt_lower, prompt_words, recent_cutoff):
+    """
+    Accumulate scores per skill index from the postings hit by the prompt.
+
+    recent_cutoff is a YYYY-MM-DD date; skills last used after it get +1.
+    """
+    scores = defaultdict(int)
+
+    for word in prompt_words:
+        for skill_idx, weight in postings.get(word, ()):
+            scores[skill_idx] += weight
+
+    for phrase, entries in phrases.items():
+        if phrase in prompt_lower:
+            for skill_idx, weight in entries:
+                scores[skill_idx] += weight
 
+    # Recent use bonus (< 7 days); ISO dates compare correctly as strings
+    for skill_idx in scores:
+        last_used = skills[skill_idx].get("lastUsed")
+        if last_used and last_used > recent_cutoff:
+            scores[skill_idx] += 1
+
+    return scores
+
+def handle(hook_input):
+    """
+    Match the hook input's prompt against the skill index.
+
+    Returns the hook output dict, or None when no skill matches strongly.
+    Kept free of stdin/stdout and sys.exit so it can be called in-process.
+    """
     # Get the user prompt
     prompt = hook_input.get("prompt", "")
     if not prompt:
         logger.debug("No prompt provided, exiting")
-        sys.exit(0)
+        return None
 
     # Prepare prompt for matching
     prompt_lower = prompt.lower()
-    prompt_words = set(prompt_lower.replace("-", " ").replace("_", " ").split())
+    prompt_words = set(_WORD_RE.findall(prompt_lower.translate(_TOKEN_TRANS)))
 
     # Load skill index
     try:
         index = load_skill_index()
-        skills = index.get("skills", [])
+        skills = index["skills"]
         logger.debug(f"Loaded {len(skills)} skills from index")
     except Exception as e:
         logger.error(f"Error loading skill index: {e}", exc_info=True)
+        return None
+
+    # Score all skills via the postings
+    recent_cutoff = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
+    scores = score_skills(skills, index["postings"], index["phrases"], prompt_lower, prompt_words, recent_cutoff)
+    candidates = [
+        (score, skill_idx)
+        for skill_idx, score in scores.items()
+        if score >= 5  # Threshold for potential match
+    ]
+    logger.debug(f"Found {len(candidates)} potential matches")
+
+    if not candidates:
+        return None
+
+    # Top 3 matches by score; index order breaks ties
+    top_matches = [
+        (score, skills[skill_idx])
+        for score, skill_idx in heapq.nlargest(3, candidates, key=lambda x: (x[0], -x[1]))
+    ]
+
+    # Check if any strong matches (score >= 10)
+    strong_matches = [(s, sk) for s, sk in top_matches if s >= 10]
+    if not strong_matches:
+        return None
+
+    # Build context for strong matches
+    lines = ["[SKILL MATCH] Relevant skills detected:"]
+    for score, skill in strong_matches:
+        name = skill.get("name", "unknown")
+        summary = skill.get("summary", "")
+        lines.append(f"  - {name} (score:{score}): {summary}")
+        lines.append(f"    Load with: cat ~/.claude/skills/{name}/SKILL.md")
+
+    logger.info(f"Matched {len(strong_matches)} skills")
+    return {
+        "hookSpecificOutput": {
+            "additionalContext": "\n".join(lines)
+        }
+    }
+
+def main():
+    logger.info("Hook started")
+
+    # Read hook input from stdin
+    try:
+        hook_input = json.load(sys.stdin)
+        logger.log_input(hook_input)
+    except json.JSONDecodeError as e:
+        logger.error(f"JSON decode error: {e}", exc_info=True)
+        sys.exit(0)
+    except Exception as e:
+        logger.error(f"Unexpected error reading input: {e}", exc_info=True)
         sys.exit(0)
 
-    # Score all skills
-    scored_skills = []
-    for skill in skills:
-        score = score_skill(skill, prompt_lower, prompt_words)
-        if score >= 5:  # Threshold for potential match
-            scored_skills.append((score, skill))
-
-    # Sort by score descending
-    scored_skills.sort(key=lambda x: x[0], reverse=True)
-    logger.debug(f"Found {len(scored_skills)} potential matches")
-
-    # Build output for matches
-    if scored_skills:
-        top_matches = scored_skills[:3]  # Top 3 matches
-
-        # Check if any strong matches (score >= 10)
-        strong_matches = [(s, sk) for s, sk in top_matches if s >= 10]
-
-        if strong_matches:
-            # Build context for strong matches
-            lines = ["[SKILL MATCH] Relevant skills detected:"]
-            for score, skill in strong_matches:
-                name = skill.get("name", "unknown")
-                summary = skill.get("summary", "")
-                lines.append(f"  - {name} (score:{score}): {summary}")
-                lines.append(f"    Load with: cat ~/.claude/skills/{name}/SKILL.md")
-
-            output = {
-                "hookSpecificOutput": {
-                    "additionalContext": "\n".join(lines)
-                }
-            }
-            logger.log_output(output)
-            print(json.dumps(output))
-            logger.info(f"Matched {len(strong_matches)} skills")
+    output = handle(hook_input)
+    if output:
+        logger.log_output(output)
+        print(json.dumps(output))
 
     logger.info("Hook completed successfully")
     sys.exit(0)
@@ -4,35 +4,48 @@ Skill Tracker Hook - PostToolUse
 Automatically tracks skill usage when SKILL.md files are read.
 
 Trigger: After Read/Write/Edit tools complete
-Action: Updates skill's metadata.json (useCount++, lastUsed)
+Action: Updates skill's metadata.json (useCount++, lastUsed) and appends
+        the use to the skill index journal
 """
 
 import json
 import sys
 import os
-import re
 from datetime import datetime
 
 # Add hooks directory to path for shared modules
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-from hook_logger import HookLogger
 
-logger = HookLogger("skill-tracker")
+# Created on first use so tool uses that aren't skill reads skip the logger entirely
+_logger = None
 
 SKILLS_DIR = os.path.expanduser("~/.claude/skills")
 
+def get_logger():
+    """Import and create the hook logger on first use."""
+    global _logger
+    if _logger is None:
+        from hook_logger import get_logger as create_logger
+        _logger = create_logger("skill-tracker")
+    return _logger
+
 def update_skill_metadata(skill_name):
     """Update a skill's metadata.json with usage info."""
+    # Imported here rather than at module level: most tool uses never get this far
+    try:
+        import orjson
+    except ImportError:
+        orjson = None
+
     metadata_path = os.path.join(SKILLS_DIR, skill_name, "metadata.json")
 
     # Load existing metadata or create new
-    metadata = {}
-    if os.path.exists(metadata_path):
-        try:
-            with open(metadata_path, 'r') as f:
-                metadata = json.load(f)
-        except (json.JSONDecodeError, IOError):
-            metadata = {}
+    try:
+        with open(metadata_path, 'rb') as f:
+            data = f.read()
+        metadata = orjson.loads(data) if orjson else json.loads(data)
+    except (json.JSONDecodeError, IOError):
+        metadata = {}
 
     # Update fields
     metadata["useCount"] = metadata.get("useCount", 0) + 1
@@ -47,92 +60,105 @@ def update_skill_metadata(skill_name):
     # Write back
     try:
         os.makedirs(os.path.dirname(metadata_path), exist_ok=True)
-        with open(metadata_path, 'w') as f:
-            json.dump(metadata, f, indent=2)
+        if orjson:
+            data = orjson.dumps(metadata, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(metadata, indent=2).encode()
+        # Write to a temp file and rename, so a crash never leaves partial JSON
+        tmp_path = metadata_path + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, metadata_path)
         return True
     except IOError:
         return False
 
 def update_skill_index(skill_name):
-    """Update the skill in the main index."""
-    index_path = os.path.join(SKILLS_DIR, "skill-index", "index.json")
+    """
+    Record the skill use in the skill index journal.
 
-    try:
-        with open(index_path, 'r') as f:
-            index = json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        return False
+    skill-matcher folds the journal into index.json before it next loads
+    the index; without it, the journal is compacted here once it gets large.
+    """
+    from skill_journal import SKILL_INDEX_PATH, JOURNAL_COMPACT_SIZE, record_use, journal_size, compact_journal
 
-    # Find and update the skill
-    for skill in index.get("skills", []):
-        if skill.get("name") == skill_name:
-            skill["useCount"] = skill.get("useCount", 0) + 1
-            skill["lastUsed"] = datetime.now().strftime("%Y-%m-%d")
-            break
+    if not os.path.exists(SKILL_INDEX_PATH):
+        return False
 
-    # Write back
     try:
-        with open(index_path, 'w') as f:
-            json.dump(index, f, indent=2)
+        record_use(skill_name, datetime.now().strftime("%Y-%m-%d"))
+        if journal_size() > JOURNAL_COMPACT_SIZE:
+            compact_journal()
         return True
     except IOError:
         return False
 
-def main():
-    logger.info("Hook started")
-
-    # Read hook input from stdin
-    try:
-        hook_input = json.load(sys.stdin)
-        logger.debug(f"Tool: {hook_input.get('tool_name', 'unknown')}")
-    except json.JSONDecodeError as e:
-        logger.error(f"JSON decode error: {e}", exc_info=True)
-        sys.exit(0)
-    except Exception as e:
-        logger.error(f"Unexpected error reading input: {e}", exc_info=True)
-        sys.exit(0)
+def handle(hook_input):
+    """
+    Record a skill use if the hook input is a Read of a SKILL.md file.
 
+    This hook produces no output, so it always returns None. Kept free of
+    stdin/stdout and sys.exit so it can be called in-process.
+    """
     # Get tool info
     tool_name = hook_input.get("tool_name", "")
     tool_input = hook_input.get("tool_input", {})
 
-    # Only track Read operations on skill files
+    # Only track Read operations on skill files; everything else returns
+    # before the logger is created
     if tool_name != "Read":
-        logger.debug(f"Not a Read operation ({tool_name}), exiting")
-        sys.exit(0)
+        return None
 
     file_path = tool_input.get("file_path", "")
-    logger.debug(f"File path: {file_path}")
 
     # Check if this is a skill file
     # Pattern: ~/.claude/skills/<skill-name>/SKILL.md
     # or: /Users/.../skills/<skill-name>/SKILL.md
-    skill_pattern = r'skills/([^/]+)/SKILL\.md$'
-    match = re.search(skill_pattern, file_path)
+    # Most reads are not skill files, so reject on the suffix first
+    if not file_path.endswith("/SKILL.md"):
+        return None
 
-    if match:
-        skill_name = match.group(1)
-        logger.info(f"Skill file detected: {skill_name}")
+    parts = file_path.rsplit("/", 3)
+    if len(parts) < 3 or parts[-3] != "skills" or not parts[-2]:
+        return None
 
-        # Don't track meta-skill index reads
-        if skill_name == "skill-index":
-            logger.debug("Skipping skill-index tracking")
-            sys.exit(0)
+    skill_name = parts[-2]
+    logger = get_logger()
+    logger.info("Hook started")
+    logger.debug(f"File path: {file_path}")
+    logger.info(f"Skill file detected: {skill_name}")
 
-        # Update metadata and index
-        if update_skill_metadata(skill_name):
-            logger.info(f"Updated metadata for skill: {skill_name}")
-        else:
-            logger.warning(f"Failed to update metadata for skill: {skill_name}")
+    # Don't track meta-skill index reads
+    if skill_name == "skill-index":
+        logger.debug("Skipping skill-index tracking")
+        return None
 
-        if update_skill_index(skill_name):
-            logger.debug(f"Updated index for skill: {skill_name}")
-        else:
-            logger.warning(f"Failed to update index for skill: {skill_name}")
+    # Update metadata and index
+    if update_skill_metadata(skill_name):
+        logger.info(f"Updated metadata for skill: {skill_name}")
+    else:
+        logger.warning(f"Failed to update metadata for skill: {skill_name}")
+
+    if update_skill_index(skill_name):
+        logger.debug(f"Updated index for skill: {skill_name}")
     else:
-        logger.debug("Not a skill file, exiting")
+        logger.warning(f"Failed to update index for skill: {skill_name}")
 
     logger.info("Hook completed successfully")
+    return None
+
+def main():
+    # Read hook input from stdin
+    try:
+        hook_input = json.load(sys.stdin)
+    except json.JSONDecodeError as e:
+        get_logger().error(f"JSON decode error: {e}", exc_info=True)
+        sys.exit(0)
+    except Exception as e:
+        get_logger().error(f"Unexpected error reading input: {e}", exc_info=True)
+        sys.exit(0)
+
+    handle(hook_input)
     sys.exit(0)
 
 if __name__ == "__main__":
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Shared skill usage journal for Claude Code hooks.
+
+Usage:
+    from skill_journal import record_use, compact_journal
+    record_use("markdown-to-pdf", "2026-01-18")   # skill-tracker, per Read
+    compact_journal()                              # skill-matcher, before loading
+
+skill-tracker appends one line per skill use instead of rewriting the whole
+skill index. The journal is folded back into index.json (useCount,
+lastUsed) by compact_journal().
+"""
+
+import os
+import json
+import time
+from collections import Counter
+
+from json_compat import HAS_ORJSON, orjson, json_loads
+
+# Compaction lock: flock on POSIX, msvcrt byte lock on Windows
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+# Skill index and its usage journal
+SKILL_INDEX_PATH = os.path.expanduser("~/.claude/skills/skill-index/index.json")
+JOURNAL_PATH = os.path.join(os.path.dirname(SKILL_INDEX_PATH), "index.journal.ndjson")
+
+# skill-tracker compacts on its own once the journal grows past this
+JOURNAL_COMPACT_SIZE = 64 * 1024
+
+
+def journal_size(journal_path=JOURNAL_PATH):
+    """Size of the pending journal in bytes (0 if there is none)."""
+    try:
+        return os.stat(journal_path).st_size
+    except OSError:
+        return 0
+
+
+def record_use(skill_name, day, journal_path=JOURNAL_PATH):
+    """Append one skill use ({"name", "ts"}) to the journal in a single write."""
+    line = json.dumps({"name": skill_name, "ts": day}) + "\n"
+    with open(journal_path, 'a') as f:
+        f.write(line)
+
+
+def _try_lock(lock_path):
+    """
+    Take an exclusive lock on lock_path without waiting.
+    Returns the open lock file (close it to release), or None if it is held.
+    """
+    f = open(lock_path, 'a+b')
+    try:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+    except OSError:
+        f.close()
+        return None
+    return f
+
+
+def _pending_batches(journal_path):
+    """
+    Journal batches renamed aside for compaction, as sorted (generation, path).
+    The unnumbered <journal>.compacting left by older versions counts as 0.
+    """
+    directory, base = os.path.split(journal_path)
+    batches = []
+    for name in os.listdir(directory or "."):
+        if name == base + ".compacting":
+            batches.append((0, os.path.join(directory, name)))
+        elif name.startswith(base + ".") and name.endswith(".compacting"):
+            generation = name[len(base) + 1:-len(".compacting")]
+            if generation.isdigit():
+                batches.append((int(generation), os.path.join(directory, name)))
+    return sorted(batches)
+
+
+def compact_journal(index_path=SKILL_INDEX_PATH, journal_path=JOURNAL_PATH):
+    """
+    Fold pending journal entries into index.json.
+
+    Only one process compacts at a time; others skip while the lock is held.
+    The journal is renamed aside as a numbered batch first, so uses recorded
+    while compacting start a fresh journal instead of being lost. index.json
+    records the last batch applied ("journalGeneration"), so a batch left
+    behind by an interrupted run is never counted twice. index.json is
+    replaced atomically, and only rewritten if an indexed skill was used.
+    Returns the number of entries applied.
+    """
+    lock = _try_lock(journal_path + ".lock")
+    if lock is None:
+        return 0  # Another hook is compacting
+    try:
+        return _compact_locked(index_path, journal_path)
+    finally:
+        lock.close()
+
+
+def _compact_locked(index_path, journal_path):
+    """compact_journal() body; the caller holds the compaction lock."""
+    batches = _pending_batches(journal_path)
+
+    # Newer than every leftover batch, so batches apply in order
+    generation = max([time.time_ns()] + [gen + 1 for gen, _ in batches])
+    pending_path = f"{journal_path}.{generation}.compacting"
+    try:
+        os.replace(journal_path, pending_path)
+        batches.append((generation, pending_path))
+    except FileNotFoundError:
+        pass
+    if not batches:
+        return 0
+
+    try:
+        with open(index_path, 'rb') as f:
+            index = json_loads(f.read())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return 0  # Keep the pending entries for a later attempt
+
+    # Batches at or below the recorded generation were applied already
+    applied = index.get("journalGeneration", -1)
+
+    use_counts = Counter()
+    last_used = {}
+    for batch_generation, path in batches:
+        if batch_generation <= applied:
+            continue
+        with open(path, 'rb') as f:
+            for line in f:
+                try:
+                    entry = json_loads(line)
+                    name, day = entry["name"], entry["ts"]
+                except (ValueError, KeyError, TypeError):
+                    continue  # Partial or malformed line
+                use_counts[name] += 1
+                if day > last_used.get(name, ""):
+                    last_used[name] = day
+
+    changed = False
+    for skill in index.get("skills", []):
+        name = skill.get("name")
+        if name in use_counts:
+            skill["useCount"] = skill.get("useCount", 0) + use_counts[name]
+            if last_used[name] > (skill.get("lastUsed") or ""):
+                skill["lastUsed"] = last_used[name]
+            changed = True
+
+    # Uses of skills that are not in the index leave index.json untouched
+    if changed:
+        index["journalGeneration"] = batches[-1][0]
+
+        if HAS_ORJSON:
+            data = orjson.dumps(index, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(index, indent=2).encode()
+
+        tmp_path = index_path + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, index_path)
+
+    for _, path in batches:
+        os.remove(path)
+
+    return sum(use_counts.values()) if changed else 0
@@ -47,6 +47,11 @@ if exist "%SETTINGS_FILE%" (
     copy "%SETTINGS_FILE%" "%BACKUP_DIR%\settings.json.backup" >nul
 )
 
+echo Installing hooks...
+REM Copied from the repository's hooks\ so every system installs the same version
+copy /Y "%~dp0..\..\hooks\hook_logger.py" "%HOOKS_DIR%\hook_logger.py" >nul
+echo   Installed: hook_logger.py
+
 echo Installing hooks via PowerShell...
 
 REM Use PowerShell to create the hook files (handles multiline content better)
@@ -55,66 +60,6 @@ $hooksDir = '%HOOKS_DIR%'; ^
 $skillsDir = '%SKILLS_DIR%'; ^
 $settingsFile = '%SETTINGS_FILE%'; ^
 ^
-# Create hook_logger.py ^
-$hookLogger = @' ^
-#!/usr/bin/env python3 ^
-import os ^
-import json ^
-import traceback ^
-from datetime import datetime ^
-from pathlib import Path ^
-^
-LOG_DIR = Path(os.path.expanduser('~/.claude/hooks/logs')) ^
-MAX_LOG_SIZE = 1_000_000 ^
-MAX_LOG_FILES = 3 ^
-^
-class HookLogger: ^
-    def __init__(self, hook_name): ^
-        self.hook_name = hook_name ^
-        self.log_dir = LOG_DIR ^
-        self.log_dir.mkdir(parents=True, exist_ok=True) ^
-        self.log_file = self.log_dir / f'{hook_name}.log' ^
-        self._rotate_if_needed() ^
-^
-    def _rotate_if_needed(self): ^
-        if self.log_file.exists() and self.log_file.stat().st_size > MAX_LOG_SIZE: ^
-            for i in range(MAX_LOG_FILES - 1, 0, -1): ^
-                old_file = self.log_dir / f'{self.hook_name}.{i}.log' ^
-                new_file = self.log_dir / f'{self.hook_name}.{i + 1}.log' ^
-                if old_file.exists(): ^
-                    if i + 1 >= MAX_LOG_FILES: ^
-                        old_file.unlink() ^
-                    else: ^
-                        old_file.rename(new_file) ^
-            backup = self.log_dir / f'{self.hook_name}.1.log' ^
-            self.log_file.rename(backup) ^
-^
-    def _write(self, level, message, **kwargs): ^
-        timestamp = datetime.now().isoformat() ^
-        entry = {'timestamp': timestamp, 'level': level, 'hook': self.hook_name, 'message': message} ^
-        if kwargs.get('exc_info'): ^
-            entry['traceback'] = traceback.format_exc() ^
-        if kwargs.get('data'): ^
-            entry['data'] = kwargs['data'] ^
-        try: ^
-            with open(self.log_file, 'a') as f: ^
-                f.write(json.dumps(entry) + '\n') ^
-        except: ^
-            pass ^
-^
-    def debug(self, msg, **kwargs): self._write('DEBUG', msg, **kwargs) ^
-    def info(self, msg, **kwargs): self._write('INFO', msg, **kwargs) ^
-    def warning(self, msg, **kwargs): self._write('WARNING', msg, **kwargs) ^
-    def error(self, msg, **kwargs): self._write('ERROR', msg, **kwargs) ^
-    def log_input(self, hook_input): ^
-        sanitized = {'prompt_length': len(hook_input.get('prompt', '')), 'prompt_preview': hook_input.get('prompt', '')[:100], 'cwd': hook_input.get('cwd', ''), 'has_transcript': bool(hook_input.get('transcript_path'))} ^
-        self.debug('Hook input received', data=sanitized) ^
-    def log_output(self, output): ^
-        self.debug('Hook output', data=output) ^
-'@ ^
-$hookLogger | Out-File -FilePath (Join-Path $hooksDir 'hook_logger.py') -Encoding utf8; ^
-Write-Host '  Created: hook_logger.py'; ^
-^
 # Create history-search.py ^
 $historySearch = @' ^
 #!/usr/bin/env python3 ^
@@ -32,122 +32,26 @@ if exist "%SETTINGS_FILE%" (
     copy "%SETTINGS_FILE%" "%BACKUP_DIR%\settings.json.backup" >nul
 )
 
-echo Installing hooks and skills via PowerShell...
+echo Installing hooks...
+REM Copied from the repository's hooks\ so there is a single source of truth
+copy /Y "%~dp0..\..\hooks\hook_logger.py" "%HOOKS_DIR%\hook_logger.py" >nul
+echo   Installed: hook_logger.py
+copy /Y "%~dp0..\..\hooks\json_compat.py" "%HOOKS_DIR%\json_compat.py" >nul
+echo   Installed: json_compat.py
+copy /Y "%~dp0..\..\hooks\skill_journal.py" "%HOOKS_DIR%\skill_journal.py" >nul
+echo   Installed: skill_journal.py
+copy /Y "%~dp0..\..\hooks\skill-matcher.py" "%HOOKS_DIR%\skill-matcher.py" >nul
+echo   Installed: skill-matcher.py
+copy /Y "%~dp0..\..\hooks\skill-tracker.py" "%HOOKS_DIR%\skill-tracker.py" >nul
+echo   Installed: skill-tracker.py
+
+echo Installing remaining hooks and skills via PowerShell...
 
 powershell -ExecutionPolicy Bypass -Command ^"^
 $hooksDir = '%HOOKS_DIR%'; ^
 $skillsDir = '%SKILLS_DIR%'; ^
 $settingsFile = '%SETTINGS_FILE%'; ^
 ^
-# Create hook_logger.py if not exists ^
-if (-not (Test-Path (Join-Path $hooksDir 'hook_logger.py'))) { ^
-    $hookLogger = @' ^
-import os, json, traceback ^
-from datetime import datetime ^
-from pathlib import Path ^
-LOG_DIR = Path(os.path.expanduser('~/.claude/hooks/logs')) ^
-class HookLogger: ^
-    def __init__(self, hook_name): ^
-        self.hook_name = hook_name ^
-        self.log_dir = LOG_DIR ^
-        self.log_dir.mkdir(parents=True, exist_ok=True) ^
-        self.log_file = self.log_dir / f'{hook_name}.log' ^
-    def _write(self, level, message, **kwargs): ^
-        entry = {'timestamp': datetime.now().isoformat(), 'level': level, 'hook': self.hook_name, 'message': message} ^
-        try: ^
-            with open(self.log_file, 'a') as f: f.write(json.dumps(entry) + '\\n') ^
-        except: pass ^
-    def debug(self, msg, **kwargs): self._write('DEBUG', msg, **kwargs) ^
-    def info(self, msg, **kwargs): self._write('INFO', msg, **kwargs) ^
-    def error(self, msg, **kwargs): self._write('ERROR', msg, **kwargs) ^
-    def log_input(self, hi): self.debug('Input', data={'len': len(hi.get('prompt',''))}) ^
-    def log_output(self, o): self.debug('Output', data=o) ^
-'@ ^
-    $hookLogger | Out-File -FilePath (Join-Path $hooksDir 'hook_logger.py') -Encoding utf8 ^
-    Write-Host '  Created: hook_logger.py' ^
-} ^
-^
-# Create skill-matcher.py ^
-$matcher = @' ^
-import json, sys, os ^
-from datetime import datetime, timedelta ^
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__))) ^
-from hook_logger import HookLogger ^
-logger = HookLogger('skill-matcher') ^
-INDEX = os.path.expanduser('~/.claude/skills/skill-index/index.json') ^
-def load_index(): ^
-    try: ^
-        with open(INDEX) as f: return json.load(f) ^
-    except: return {'skills': []} ^
-def score(skill, pl, pw): ^
-    s = 0 ^
-    for t in [x.lower() for x in skill.get('tags', [])]: ^
-        if t in pl: s += 3 ^
-        for tw in t.split('-'): ^
-            if tw in pw and len(tw) > 2: s += 2 ^
-    if skill.get('category', '').lower() in pl: s += 5 ^
-    sw = set(skill.get('summary', '').lower().split()) ^
-    s += len((pw & sw) - {'a','an','the','with','and','or','for','to','in','on','by','is','are'}) * 2 ^
-    for p in skill.get('name', '').lower().replace('-',' ').split(): ^
-        if p in pw and len(p) > 2: s += 3 ^
-    return s ^
-def main(): ^
-    logger.info('Started') ^
-    try: hi = json.load(sys.stdin) ^
-    except: sys.exit(0) ^
-    prompt = hi.get('prompt', '') ^
-    if not prompt: sys.exit(0) ^
-    pl, pw = prompt.lower(), set(prompt.lower().replace('-',' ').replace('_',' ').split()) ^
-    idx = load_index() ^
-    scored = [(score(sk, pl, pw), sk) for sk in idx.get('skills', []) if score(sk, pl, pw) >= 10] ^
-    scored.sort(key=lambda x: x[0], reverse=True) ^
-    if scored: ^
-        lines = ['[SKILL MATCH] Relevant skills detected:'] ^
-        for sc, sk in scored[:3]: ^
-            lines.append(f\"  - {sk.get('name')} (score:{sc}): {sk.get('summary', '')}\") ^
-            lines.append(f\"    Load: cat ~/.claude/skills/{sk.get('name')}/SKILL.md\") ^
-        print(json.dumps({'hookSpecificOutput': {'additionalContext': '\\n'.join(lines)}}), flush=True) ^
-    sys.exit(0) ^
-if __name__ == '__main__': main() ^
-'@ ^
-$matcher | Out-File -FilePath (Join-Path $hooksDir 'skill-matcher.py') -Encoding utf8 ^
-Write-Host '  Created: skill-matcher.py' ^
-^
-# Create skill-tracker.py ^
-$tracker = @' ^
-import json, sys, os, re ^
-from datetime import datetime ^
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__))) ^
-from hook_logger import HookLogger ^
-logger = HookLogger('skill-tracker') ^
-SKILLS = os.path.expanduser('~/.claude/skills') ^
-def main(): ^
-    logger.info('Started') ^
-    try: hi = json.load(sys.stdin) ^
-    except: sys.exit(0) ^
-    if hi.get('tool_name') != 'Read': sys.exit(0) ^
-    fp = hi.get('tool_input', {}).get('file_path', '') ^
-    m = re.search(r'skills/([^/]+)/SKILL\\.md$', fp) ^
-    if m and m.group(1) != 'skill-index': ^
-        name = m.group(1) ^
-        mp = os.path.join(SKILLS, name, 'metadata.json') ^
-        md = {} ^
-        if os.path.exists(mp): ^
-            try: ^
-                with open(mp) as f: md = json.load(f) ^
-            except: pass ^
-        md['useCount'] = md.get('useCount', 0) + 1 ^
-        md['lastUsed'] = datetime.now().strftime('%Y-%m-%d') ^
-        try: ^
-            with open(mp, 'w') as f: json.dump(md, f, indent=2) ^
-            logger.info(f'Updated {name}') ^
-        except: pass ^
-    sys.exit(0) ^
-if __name__ == '__main__': main() ^
-'@ ^
-$tracker | Out-File -FilePath (Join-Path $hooksDir 'skill-tracker.py') -Encoding utf8 ^
-Write-Host '  Created: skill-tracker.py' ^
-^
 # Create detect-learning.py ^
 $detect = @' ^
 import json, sys, os, re ^
@@ -34,6 +34,9 @@ SKILLS_DIR="$CLAUDE_DIR/skills"
 SETTINGS_FILE="$CLAUDE_DIR/settings.json"
 BACKUP_DIR="$CLAUDE_DIR/backups/system-c-$(date +%Y%m%d_%H%M%S)"
 
+# Repository root (hooks are copied from its hooks/ directory)
+REPO_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")/../.." && pwd)"
+
 # Create directories
 echo -e "${YELLOW}Creating directories...${NC}"
 mkdir -p "$HOOKS_DIR"
@@ -48,273 +51,21 @@ if [ -f "$SETTINGS_FILE" ]; then
 fi
 
 # -------------------------------------------
-# HOOK: hook_logger.py
+# HOOKS: hook_logger.py, json_compat.py, skill_journal.py, skill-matcher.py, skill-tracker.py
 # -------------------------------------------
 echo -e "${YELLOW}Installing hooks...${NC}"
 
-if [ ! -f "$HOOKS_DIR/hook_logger.py" ]; then
-cat > "$HOOKS_DIR/hook_logger.py" << 'HOOK_LOGGER_EOF'
-#!/usr/bin/env python3
-"""
-Shared logging utility for Claude Code hooks.
-"""
-
-import os
-import json
-import traceback
-from datetime import datetime
-from pathlib import Path
-
-LOG_DIR = Path(os.path.expanduser("~/.claude/hooks/logs"))
-MAX_LOG_SIZE = 1_000_000
-MAX_LOG_FILES = 3
-
-class HookLogger:
-    def __init__(self, hook_name: str):
-        self.hook_name = hook_name
-        self.log_dir = LOG_DIR
-        self.log_dir.mkdir(parents=True, exist_ok=True)
-        self.log_file = self.log_dir / f"{hook_name}.log"
-        self._rotate_if_needed()
-
-    def _rotate_if_needed(self):
-        if self.log_file.exists() and self.log_file.stat().st_size > MAX_LOG_SIZE:
-            for i in range(MAX_LOG_FILES - 1, 0, -1):
-                old_file = self.log_dir / f"{self.hook_name}.{i}.log"
-                new_file = self.log_dir / f"{self.hook_name}.{i + 1}.log"
-                if old_file.exists():
-                    if i + 1 >= MAX_LOG_FILES:
-                        old_file.unlink()
-                    else:
-                        old_file.rename(new_file)
-            backup = self.log_dir / f"{self.hook_name}.1.log"
-            self.log_file.rename(backup)
-
-    def _write(self, level: str, message: str, **kwargs):
-        timestamp = datetime.now().isoformat()
-        entry = {"timestamp": timestamp, "level": level, "hook": self.hook_name, "message": message}
-        if kwargs.get("exc_info"):
-            entry["traceback"] = traceback.format_exc()
-        if kwargs.get("data"):
-            entry["data"] = kwargs["data"]
-        try:
-            with open(self.log_file, "a") as f:
-                f.write(json.dumps(entry) + "\n")
-        except Exception:
-            pass
-
-    def debug(self, message: str, **kwargs): self._write("DEBUG", message, **kwargs)
-    def info(self, message: str, **kwargs): self._write("INFO", message, **kwargs)
-    def warning(self, message: str, **kwargs): self._write("WARNING", message, **kwargs)
-    def error(self, message: str, **kwargs): self._write("ERROR", message, **kwargs)
-    def log_input(self, hook_input: dict):
-        sanitized = {"prompt_length": len(hook_input.get("prompt", "")), "prompt_preview": hook_input.get("prompt", "")[:100], "cwd": hook_input.get("cwd", ""), "has_transcript": bool(hook_input.get("transcript_path"))}
-        self.debug("Hook input received", data=sanitized)
-    def log_output(self, output: dict): self.debug("Hook output", data=output)
-HOOK_LOGGER_EOF
-echo "  Created: hook_logger.py"
-fi
-
-# -------------------------------------------
-# HOOK: skill-matcher.py
-# -------------------------------------------
-cat > "$HOOKS_DIR/skill-matcher.py" << 'SKILL_MATCHER_EOF'
-#!/usr/bin/env python3
-"""
-Skill Matcher Hook - UserPromptSubmit
-Automatically suggests relevant skills based on user prompts.
-"""
-
-import json
-import sys
-import os
-from datetime import datetime, timedelta
-
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-from hook_logger import HookLogger
-
-logger = HookLogger("skill-matcher")
-SKILL_INDEX_PATH = os.path.expanduser("~/.claude/skills/skill-index/index.json")
-
-def load_skill_index():
-    try:
-        with open(SKILL_INDEX_PATH, 'r') as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        return {"skills": []}
-
-def score_skill(skill, prompt_lower, prompt_words):
-    score = 0
-    tags = [t.lower() for t in skill.get("tags", [])]
-    for tag in tags:
-        if tag in prompt_lower:
-            score += 3
-        for tag_word in tag.split("-"):
-            if tag_word in prompt_words and len(tag_word) > 2:
-                score += 2
-    category = skill.get("category", "").lower()
-    if category in prompt_lower:
-        score += 5
-    summary = skill.get("summary", "").lower()
-    summary_words = set(summary.split())
-    matching_summary_words = prompt_words & summary_words
-    common_words = {"a", "an", "the", "with", "and", "or", "for", "to", "in", "on", "by", "is", "are"}
-    meaningful_matches = matching_summary_words - common_words
-    score += len(meaningful_matches) * 2
-    name = skill.get("name", "").lower()
-    name_parts = name.replace("-", " ").split()
-    for part in name_parts:
-        if part in prompt_words and len(part) > 2:
-            score += 3
-    last_used = skill.get("lastUsed")
-    if last_used:
-        try:
-            last_used_date = datetime.strptime(last_used, "%Y-%m-%d")
-            if datetime.now() - last_used_date < timedelta(days=7):
-                score += 1
-        except ValueError:
-            pass
-    return score
-
-def main():
-    logger.info("Hook started")
-    try:
-        hook_input = json.load(sys.stdin)
-        logger.log_input(hook_input)
-    except Exception as e:
-        logger.error(f"Error reading input: {e}", exc_info=True)
-        sys.exit(0)
-    prompt = hook_input.get("prompt", "")
-    if not prompt:
-        sys.exit(0)
-    prompt_lower = prompt.lower()
-    prompt_words = set(prompt_lower.replace("-", " ").replace("_", " ").split())
-    try:
-        index = load_skill_index()
-        skills = index.get("skills", [])
-    except Exception as e:
-        logger.error(f"Error loading skill index: {e}", exc_info=True)
-        sys.exit(0)
-    scored_skills = []
-    for skill in skills:
-        score = score_skill(skill, prompt_lower, prompt_words)
-        if score >= 5:
-            scored_skills.append((score, skill))
-    scored_skills.sort(key=lambda x: x[0], reverse=True)
-    if scored_skills:
-        top_matches = scored_skills[:3]
-        strong_matches = [(s, sk) for s, sk in top_matches if s >= 10]
-        if strong_matches:
-            lines = ["[SKILL MATCH] Relevant skills detected:"]
-            for score, skill in strong_matches:
-                name = skill.get("name", "unknown")
-                summary = skill.get("summary", "")
-                lines.append(f"  - {name} (score:{score}): {summary}")
-                lines.append(f"    Load with: cat ~/.claude/skills/{name}/SKILL.md")
-            output = {"hookSpecificOutput": {"additionalContext": "\n".join(lines)}}
-            logger.log_output(output)
-            print(json.dumps(output), flush=True)
-    logger.info("Hook completed")
-    sys.exit(0)
-
-if __name__ == "__main__":
-    main()
-SKILL_MATCHER_EOF
-echo "  Created: skill-matcher.py"
-
-# -------------------------------------------
-# HOOK: skill-tracker.py
-# -------------------------------------------
-cat > "$HOOKS_DIR/skill-tracker.py" << 'SKILL_TRACKER_EOF'
-#!/usr/bin/env python3
-"""
-Skill Tracker Hook - PostToolUse
-Automatically tracks skill usage when SKILL.md files are read.
-"""
-
-import json
-import sys
-import os
-import re
-from datetime import datetime
-
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-from hook_logger import HookLogger
-
-logger = HookLogger("skill-tracker")
-SKILLS_DIR = os.path.expanduser("~/.claude/skills")
-
-def update_skill_metadata(skill_name):
-    metadata_path = os.path.join(SKILLS_DIR, skill_name, "metadata.json")
-    metadata = {}
-    if os.path.exists(metadata_path):
-        try:
-            with open(metadata_path, 'r') as f:
-                metadata = json.load(f)
-        except (json.JSONDecodeError, IOError):
-            metadata = {}
-    metadata["useCount"] = metadata.get("useCount", 0) + 1
-    metadata["lastUsed"] = datetime.now().strftime("%Y-%m-%d")
-    if "successCount" not in metadata:
-        metadata["successCount"] = 0
-    if "failureCount" not in metadata:
-        metadata["failureCount"] = 0
-    try:
-        os.makedirs(os.path.dirname(metadata_path), exist_ok=True)
-        with open(metadata_path, 'w') as f:
-            json.dump(metadata, f, indent=2)
-        return True
-    except IOError:
-        return False
-
-def update_skill_index(skill_name):
-    index_path = os.path.join(SKILLS_DIR, "skill-index", "index.json")
-    try:
-        with open(index_path, 'r') as f:
-            index = json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        return False
-    for skill in index.get("skills", []):
-        if skill.get("name") == skill_name:
-            skill["useCount"] = skill.get("useCount", 0) + 1
-            skill["lastUsed"] = datetime.now().strftime("%Y-%m-%d")
-            break
-    try:
-        with open(index_path, 'w') as f:
-            json.dump(index, f, indent=2)
-        return True
-    except IOError:
-        return False
-
-def main():
-    logger.info("Hook started")
-    try:
-        hook_input = json.load(sys.stdin)
-    except Exception as e:
-        logger.error(f"Error reading input: {e}", exc_info=True)
-        sys.exit(0)
-    tool_name = hook_input.get("tool_name", "")
-    tool_input = hook_input.get("tool_input", {})
-    if tool_name != "Read":
-        sys.exit(0)
-    file_path = tool_input.get("file_path", "")
-    skill_pattern = r'skills/([^/]+)/SKILL\.md$'
-    match = re.search(skill_pattern, file_path)
-    if match:
-        skill_name = match.group(1)
-        if skill_name == "skill-index":
-            sys.exit(0)
-        if update_skill_metadata(skill_name):
-            logger.info(f"Updated metadata for skill: {skill_name}")
-        if update_skill_index(skill_name):
-            logger.debug(f"Updated index for skill: {skill_name}")
-    logger.info("Hook completed")
-    sys.exit(0)
-
-if __name__ == "__main__":
-    main()
-SKILL_TRACKER_EOF
-echo "  Created: skill-tracker.py"
+# Copied from the repository's hooks/ so there is a single source of truth
+cp "$REPO_DIR/hooks/hook_logger.py" "$HOOKS_DIR/hook_logger.py"
+echo "  Installed: hook_logger.py"
+cp "$REPO_DIR/hooks/json_compat.py" "$HOOKS_DIR/json_compat.py"
+echo "  Installed: json_compat.py"
+cp "$REPO_DIR/hooks/skill_journal.py" "$HOOKS_DIR/skill_journal.py"
+echo "  Installed: skill_journal.py"
+cp "$REPO_DIR/hooks/skill-matcher.py" "$HOOKS_DIR/skill-matcher.py"
+echo "  Installed: skill-matcher.py"
+cp "$REPO_DIR/hooks/skill-tracker.py" "$HOOKS_DIR/skill-tracker.py"
+echo "  Installed: skill-tracker.py"
 
 # -------------------------------------------
 # HOOK: detect-learning.py
@@ -29,6 +29,10 @@ if exist "%HOOKS_DIR%\skill-tracker.py" (
     del "%HOOKS_DIR%\skill-tracker.py"
     echo   Removed: skill-tracker.py
 )
+if exist "%HOOKS_DIR%\skill_journal.py" (
+    del "%HOOKS_DIR%\skill_journal.py"
+    echo   Removed: skill_journal.py
+)
 if exist "%HOOKS_DIR%\detect-learning.py" (
     del "%HOOKS_DIR%\detect-learning.py"
     echo   Removed: detect-learning.py
@@ -93,7 +97,7 @@ echo   - 4 hooks
 echo   - 18 skills
 echo.
 echo Preserved:
-echo   - hook_logger.py (may be used by other systems)
+echo   - hook_logger.py, json_compat.py (may be used by other systems)
 echo.
 echo Restart Claude Code or run /hooks to reload hooks.
 echo.
@@ -9,7 +9,7 @@
 # - Associated settings.json entries
 #
 # Does NOT remove:
-# - hook_logger.py (may be used by other systems)
+# - hook_logger.py, json_compat.py (may be used by other systems)
 # - Session data
 #
 
@@ -35,7 +35,7 @@ SETTINGS_FILE="$CLAUDE_DIR/settings.json"
 
 echo -e "${YELLOW}Removing System C hooks...${NC}"
 
-for hook in skill-matcher.py skill-tracker.py detect-learning.py learning-moment-pickup.py; do
+for hook in skill-matcher.py skill-tracker.py skill_journal.py detect-learning.py learning-moment-pickup.py; do
     if [ -f "$HOOKS_DIR/$hook" ]; then
         rm "$HOOKS_DIR/$hook"
         echo "  Removed: $hook"
@@ -141,6 +141,6 @@ echo "  - 4 hooks (skill-matcher, skill-tracker, detect-learning, learning-momen
 echo "  - 18 skills"
 echo ""
 echo -e "${YELLOW}Preserved:${NC}"
-echo "  - hook_logger.py (may be used by other systems)"
+echo "  - hook_logger.py, json_compat.py (may be used by other systems)"
 echo ""
 echo "Restart Claude Code or run /hooks to reload hooks."
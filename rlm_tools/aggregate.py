@@ -12,13 +12,27 @@ into a structured format for final answer synthesis.
 """
 
 import argparse
+import io
 import json
 import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from glob import glob
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import IO, List, Dict, Any, Optional
+
+# Add rlm_tools directory to path for chunk.py's JSON loader
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from chunk import json_loads
+
+
+# Characters a JSON document can start with (after whitespace); anything else is text
+_JSON_START = frozenset('{["-0123456789tfn')
+_JSON_WS_RE = re.compile(r'[ \t\n\r]*')
+
+# "Key: Value" lines, split at the first colon (URLs are not keys)
+_KV_RE = re.compile(r'^(?!http)([^:\n]*):([^\n]*)$', re.MULTILINE)
 
 
 def read_result_file(filepath: str) -> Dict[str, Any]:
@@ -28,37 +42,40 @@ def read_result_file(filepath: str) -> Dict[str, Any]:
     with open(path, 'r', encoding='utf-8', errors='ignore') as f:
         content = f.read()
 
-    # Try to parse as JSON first
-    try:
-        data = json.loads(content)
-        return {
-            "file": path.name,
-            "type": "json",
-            "content": data
-        }
-    except json.JSONDecodeError:
-        pass
+    # Try to parse as JSON first, unless the first character rules it out
+    start = _JSON_WS_RE.match(content).end()
+    if content[start:start + 1] in _JSON_START:
+        try:
+            data = json_loads(content)
+            size = len(content.strip())
+            return {
+                "file": path.name,
+                "type": "json",
+                "content": data,
+                "_size": size,
+                "_substantive": size > 50
+            }
+        except json.JSONDecodeError:
+            pass
 
     # Parse as plain text with potential key-value structure
+    content = content.strip()
     result = {
         "file": path.name,
         "type": "text",
-        "content": content.strip(),
-        "extracted": {}
+        "content": content,
+        "extracted": {},
+        "_size": len(content),
+        "_substantive": len(content) > 50
     }
 
-    # Try to extract structured information
-    lines = content.strip().split('\n')
-
-    # Look for "Key: Value" patterns
-    for line in lines:
-        if ':' in line and not line.startswith('http'):
-            parts = line.split(':', 1)
-            if len(parts) == 2:
-                key = parts[0].strip().lower().replace(' ', '_')
-                value = parts[1].strip()
-                if key and value and len(key) < 50:
-                    result["extracted"][key] = value
+    # Look for "Key: Value" patterns (lines without a colon never reach Python)
+    extracted = result["extracted"]
+    for match in _KV_RE.finditer(content):
+        key = match.group(1).strip().lower().replace(' ', '_')
+        value = match.group(2).strip()
+        if key and value and len(key) < 50:
+            extracted[key] = value
 
     return result
 
@@ -76,10 +93,13 @@ def aggregate_results(results_dir: str, pattern: str = "*.txt") -> Dict[str, Any
     if not files:
         return {"error": f"No files matching '{pattern}' found in {results_dir}"}
 
-    results = []
-    for filepath in files:
-        result = read_result_file(filepath)
-        results.append(result)
+    # Read files concurrently; map() keeps the sorted file order
+    if len(files) > 1:
+        max_workers = min(32, (os.cpu_count() or 4) * 4, len(files))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(read_result_file, files))
+    else:
+        results = [read_result_file(filepath) for filepath in files]
 
     return {
         "total_files": len(results),
@@ -88,38 +108,43 @@ def aggregate_results(results_dir: str, pattern: str = "*.txt") -> Dict[str, Any
     }
 
 
-def combine_for_synthesis(aggregated: Dict[str, Any], query: str = None) -> str:
-    """Combine results into a format suitable for LLM synthesis."""
-    if "error" in aggregated:
-        return f"Error: {aggregated['error']}"
-
-    output = []
+def combine_for_synthesis(aggregated: Dict[str, Any], query: str = None,
+                          out: Optional[IO[str]] = None) -> Optional[str]:
+    """
+    Combine results into a format suitable for LLM synthesis.
 
-    if query:
-        output.append(f"# Query: {query}")
-        output.append("")
+    Written piece by piece to out when given (returns None), otherwise to an
+    in-memory buffer whose contents are returned.
+    """
+    buf = out if out is not None else io.StringIO()
+    write = buf.write
 
-    output.append(f"# Aggregated Results ({aggregated['total_files']} chunks processed)")
-    output.append("")
+    if "error" in aggregated:
+        write(f"Error: {aggregated['error']}")
+    else:
+        if query:
+            write(f"# Query: {query}\n\n")
 
-    for result in aggregated["results"]:
-        output.append(f"## {result['file']}")
-        output.append("")
+        write(f"# Aggregated Results ({aggregated['total_files']} chunks processed)\n")
 
-        if result["type"] == "json":
-            output.append("```json")
-            output.append(json.dumps(result["content"], indent=2))
-            output.append("```")
-        else:
-            content = result["content"]
-            # Truncate very long content
-            if len(content) > 5000:
-                content = content[:5000] + "\n... [truncated]"
-            output.append(content)
+        for result in aggregated["results"]:
+            write(f"\n## {result['file']}\n\n")
 
-        output.append("")
+            if result["type"] == "json":
+                write("```json\n")
+                json.dump(result["content"], buf, indent=2)
+                write("\n```\n")
+            else:
+                content = result["content"]
+                # Truncate very long content
+                if len(content) > 5000:
+                    content = content[:5000] + "\n... [truncated]"
+                write(content)
+                write("\n")
 
-    return '\n'.join(output)
+    if out is None:
+        return buf.getvalue()
+    return None
 
 
 def summarize_results(aggregated: Dict[str, Any]) -> Dict[str, Any]:
@@ -136,11 +161,11 @@ def summarize_results(aggregated: Dict[str, Any]) -> Dict[str, Any]:
     }
 
     for result in aggregated["results"]:
-        content = result["content"] if isinstance(result["content"], str) else json.dumps(result["content"])
-        summary["total_chars"] += len(content)
+        # Sizes were measured when the file was read (characters, stripped)
+        summary["total_chars"] += result["_size"]
 
         # Count chunks with substantive findings
-        if len(content.strip()) > 50:
+        if result["_substantive"]:
             summary["chunks_with_findings"] += 1
 
         # Collect extracted keys
@@ -158,17 +183,31 @@ def summarize_results(aggregated: Dict[str, Any]) -> Dict[str, Any]:
     return summary
 
 
+def public_aggregation(aggregated: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy of aggregated for serialization, without the internal "_" keys
+    (sizes recorded for summarize_results) on each result.
+    """
+    if "error" in aggregated:
+        return aggregated
+    public = dict(aggregated)
+    public["results"] = [
+        {key: value for key, value in result.items() if not key.startswith("_")}
+        for result in aggregated["results"]
+    ]
+    return public
+
+
 def save_aggregation(aggregated: Dict[str, Any], output_path: str, query: str = None):
     """Save aggregation results to file."""
     output = Path(output_path)
 
     if output.suffix == '.json':
         with open(output, 'w') as f:
-            json.dump(aggregated, f, indent=2)
+            json.dump(public_aggregation(aggregated), f, indent=2)
     else:
-        combined = combine_for_synthesis(aggregated, query)
         with open(output, 'w') as f:
-            f.write(combined)
+            combine_for_synthesis(aggregated, query, out=f)
 
 
 def main():
@@ -195,20 +234,26 @@ def main():
         sys.exit(1)
 
     # Output based on format
-    if args.format == "json":
-        output = json.dumps(aggregated, indent=2)
-    elif args.format == "summary":
-        summary = summarize_results(aggregated)
-        output = json.dumps(summary, indent=2)
-    else:
-        output = combine_for_synthesis(aggregated, args.query)
-
-    if args.output:
+    if args.format == "text" and args.output:
+        # Stream straight to the file instead of building the text first
         with open(args.output, 'w') as f:
-            f.write(output)
+            combine_for_synthesis(aggregated, args.query, out=f)
         print(f"Aggregation saved to: {args.output}")
     else:
-        print(output)
+        if args.format == "json":
+            output = json.dumps(public_aggregation(aggregated), indent=2)
+        elif args.format == "summary":
+            summary = summarize_results(aggregated)
+            output = json.dumps(summary, indent=2)
+        else:
+            output = combine_for_synthesis(aggregated, args.query)
+
+        if args.output:
+            with open(args.output, 'w') as f:
+                f.write(output)
+            print(f"Aggregation saved to: {args.output}")
+        else:
+            print(output)
 
     # Print summary stats
     if args.format != "summary":
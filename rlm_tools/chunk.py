@@ -17,23 +17,115 @@ Strategies:
 
 import argparse
 import json
+import mmap
 import os
 import re
 import sys
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Tuple
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+# Try to import orjson for faster JSON reads and manifest writes, fall back to stdlib json
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either
+json_loads = orjson.loads if HAS_ORJSON else json.loads
+
+
+# Markdown ATX headers and paragraph breaks
+_HEADER_RE = re.compile(r'^(#{1,6})\s+(.+)$', re.MULTILINE)
+_PARA_SPLIT_RE = re.compile(r'\n\n+')
+
+# detect_language probes, checked in this order over the first
+# _DETECT_SAMPLE_CHARS characters of the text
+_DETECT_SAMPLE_CHARS = 65536
+_PY_DEF_RE = re.compile(r'^(def |class |import |from .+ import |async def )', re.MULTILINE)
+_PY_COLON_RE = re.compile(r':\s*$', re.MULTILINE)
+_RUST_SYNTAX_RE = re.compile(r'(use\s+std::|use\s+\w+::|::<|->|&self|&mut\s+self|impl\s+\w+|Result<|Option<|pub\s+fn|pub\s+struct|pub\s+enum)')
+_RUST_ITEM_RE = re.compile(r'^(pub\s+)?(fn|struct|enum|impl|trait|mod)\s+\w+', re.MULTILINE)
+_GO_RE = re.compile(r'^(func\s+\w+|package\s+\w+|type\s+\w+\s+struct)', re.MULTILINE)
+_JS_RE = re.compile(r'(function\s+\w+|const\s+\w+\s*=|let\s+\w+\s*=|var\s+\w+\s*=|\=\>\s*\{)')
+_TS_RE = re.compile(r'(interface\s+\w+|type\s+\w+\s*=|:\s*(string|number|boolean|any))')
+_JAVA_RE = re.compile(r'(public\s+class|private\s+class|class\s+\w+\s*\{)')
+
+# Language-specific definition patterns for find_code_boundaries
+_CODE_PATTERN_SOURCES = {
+    "python": [
+        (r'^class\s+(\w+)[^:]*:', "class"),
+        (r'^(?:async\s+)?def\s+(\w+)\s*\([^)]*\)\s*(?:->[^:]+)?:', "function"),
+    ],
+    "javascript": [
+        (r'^class\s+(\w+)', "class"),
+        (r'^(?:async\s+)?function\s+(\w+)', "function"),
+        (r'^(?:const|let|var)\s+(\w+)\s*=\s*(?:async\s+)?\([^)]*\)\s*=>', "arrow_function"),
+        (r'^(?:const|let|var)\s+(\w+)\s*=\s*function', "function"),
+        (r'^export\s+(?:default\s+)?(?:async\s+)?function\s+(\w+)', "function"),
+    ],
+    "typescript": [
+        (r'^(?:export\s+)?class\s+(\w+)', "class"),
+        (r'^(?:export\s+)?interface\s+(\w+)', "interface"),
+        (r'^(?:export\s+)?type\s+(\w+)', "type"),
+        (r'^(?:export\s+)?(?:async\s+)?function\s+(\w+)', "function"),
+        (r'^(?:export\s+)?(?:const|let|var)\s+(\w+)\s*(?::\s*[^=]+)?\s*=\s*(?:async\s+)?\([^)]*\)\s*(?::\s*[^=]+)?\s*=>', "arrow_function"),
+    ],
+    "go": [
+        (r'^func\s+(?:\([^)]+\)\s+)?(\w+)', "function"),
+        (r'^type\s+(\w+)\s+struct', "struct"),
+        (r'^type\s+(\w+)\s+interface', "interface"),
+    ],
+    "rust": [
+        (r'^(?:pub\s+)?fn\s+(\w+)', "function"),
+        (r'^(?:pub\s+)?struct\s+(\w+)', "struct"),
+        (r'^(?:pub\s+)?enum\s+(\w+)', "enum"),
+        (r'^impl(?:<[^>]+>)?\s+(\w+)', "impl"),
+        (r'^(?:pub\s+)?trait\s+(\w+)', "trait"),
+    ],
+    "java": [
+        (r'^(?:public|private|protected)?\s*class\s+(\w+)', "class"),
+        (r'^(?:public|private|protected)\s+(?:static\s+)?(?:\w+(?:<[^>]+>)?)\s+(\w+)\s*\(', "method"),
+    ],
+}
+
+
+def _compile_boundary_scan(patterns: List[Tuple[str, str]]) -> Tuple[re.Pattern, Tuple[str, ...]]:
+    """
+    Merge one language's patterns into a single multiline alternation.
+    Alternative i is wrapped in group 2*i+1 and its name is group 2*i+2.
+    """
+    alternatives = []
+    for pattern, _ in patterns:
+        # Keep every match on one line, as when lines were matched one by one
+        pattern = pattern[1:].replace('[^', '[^\\n').replace(r'\s', r'[^\S\n]')
+        alternatives.append(f'({pattern})')
+    combined = r'^[^\S\n]*(?:' + '|'.join(alternatives) + ')'
+    return re.compile(combined, re.MULTILINE), tuple(entity_type for _, entity_type in patterns)
+
+
+_CODE_BOUNDARY_SCANS = {
+    language: _compile_boundary_scan(patterns)
+    for language, patterns in _CODE_PATTERN_SOURCES.items()
+}
 
 
 class ProgressTracker:
     """Simple progress tracker for chunk processing."""
 
-    def __init__(self, total: int, description: str = "Processing", show_progress: bool = True):
+    # Minimum seconds between redraws; the final update always draws
+    RENDER_INTERVAL = 1 / 30
+
+    def __init__(self, total: Optional[int], description: str = "Processing", show_progress: bool = True):
         self.total = total
         self.current = 0
         self.description = description
         self.show_progress = show_progress
         self.start_time = time.time()
+        self._last_render = 0.0
 
     def update(self, increment: int = 1, item_name: str = None):
         """Update progress."""
@@ -43,6 +135,18 @@ class ProgressTracker:
 
     def _display(self, item_name: str = None):
         """Display progress bar."""
+        now = time.monotonic()
+        if (self.total is None or self.current < self.total) and now - self._last_render < self.RENDER_INTERVAL:
+            return
+        self._last_render = now
+
+        item_info = f" ({item_name})" if item_name else ""
+        if self.total is None:
+            # Total not known up front (chunks streamed from a generator): show a count
+            sys.stdout.write(f"\r{self.description}: {self.current}{item_info}    ")
+            sys.stdout.flush()
+            return
+
         percent = (self.current / self.total) * 100 if self.total > 0 else 100
         bar_length = 30
         filled = int(bar_length * self.current / self.total) if self.total > 0 else bar_length
@@ -55,7 +159,6 @@ class ProgressTracker:
         else:
             eta_str = "..."
 
-        item_info = f" ({item_name})" if item_name else ""
         sys.stdout.write(f"\r{self.description}: |{bar}| {self.current}/{self.total} ({percent:.1f}%) {eta_str}{item_info}    ")
         sys.stdout.flush()
 
@@ -66,130 +169,133 @@ class ProgressTracker:
         """Complete the progress tracking."""
         elapsed = time.time() - self.start_time
         if self.show_progress:
-            print(f"\nCompleted {self.total} items in {elapsed:.2f}s")
+            print(f"\nCompleted {self.current} items in {elapsed:.2f}s")
 
 
-def chunk_by_size(text: str, chunk_size: int, overlap: int = 500) -> List[Tuple[str, dict]]:
-    """Split text into chunks of approximately chunk_size characters."""
-    chunks = []
-    start = 0
+def chunk_by_size(text: str, chunk_size: int, overlap: int = 500,
+                  start: int = 0, stop: int = None) -> Iterator[Tuple[str, dict]]:
+    """
+    Split text into chunks of approximately chunk_size characters.
+    Only text[start:stop] is chunked; offsets in the metadata stay relative to text.
+    """
+    text_len = len(text) if stop is None else stop
     chunk_num = 1
 
-    while start < len(text):
+    while start < text_len:
         end = start + chunk_size
 
         # Try to end at a natural boundary (newline, period, space)
-        if end < len(text):
+        if end < text_len:
             # Look for newline first
-            newline_pos = text.rfind('\n', start + chunk_size - 1000, end + 100)
+            newline_pos = text.rfind('\n', start + chunk_size - 1000, min(end + 100, text_len))
             if newline_pos > start:
                 end = newline_pos + 1
             else:
                 # Look for period
-                period_pos = text.rfind('. ', start + chunk_size - 500, end + 50)
+                period_pos = text.rfind('. ', start + chunk_size - 500, min(end + 50, text_len))
                 if period_pos > start:
                     end = period_pos + 2
                 else:
                     # Look for space
-                    space_pos = text.rfind(' ', start + chunk_size - 200, end + 20)
+                    space_pos = text.rfind(' ', start + chunk_size - 200, min(end + 20, text_len))
                     if space_pos > start:
                         end = space_pos + 1
 
-        chunk_text = text[start:end]
+        end = min(end, text_len)
+
+        # Counts run over the original buffer; only the chunk itself is copied
         metadata = {
             "chunk_num": chunk_num,
             "start_char": start,
             "end_char": end,
-            "char_count": len(chunk_text),
-            "line_count": chunk_text.count('\n') + 1
+            "char_count": end - start,
+            "line_count": text.count('\n', start, end) + 1
         }
 
-        chunks.append((chunk_text, metadata))
+        yield text[start:end], metadata
 
         # Move start with overlap for context continuity
-        start = end - overlap if end < len(text) else end
+        start = end - overlap if end < text_len else end
         chunk_num += 1
 
-    return chunks
-
 
-def chunk_by_lines(text: str, lines_per_chunk: int, overlap_lines: int = 10) -> List[Tuple[str, dict]]:
+def chunk_by_lines(text: str, lines_per_chunk: int, overlap_lines: int = 10) -> Iterator[Tuple[str, dict]]:
     """Split text by line count."""
-    lines = text.split('\n')
-    chunks = []
+    # Line i is text[line_breaks[i] + 1:line_breaks[i + 1]]; chunks are sliced
+    # straight from text instead of splitting and re-joining every line
+    line_breaks = [-1]
+    pos = text.find('\n')
+    while pos != -1:
+        line_breaks.append(pos)
+        pos = text.find('\n', pos + 1)
+    line_breaks.append(len(text))
+
+    total_lines = len(line_breaks) - 1
     start = 0
     chunk_num = 1
 
-    while start < len(lines):
-        end = min(start + lines_per_chunk, len(lines))
-        chunk_lines = lines[start:end]
-        chunk_text = '\n'.join(chunk_lines)
+    while start < total_lines:
+        end = min(start + lines_per_chunk, total_lines)
+        start_char = line_breaks[start] + 1
+        end_char = line_breaks[end]
 
         metadata = {
             "chunk_num": chunk_num,
             "start_line": start,
             "end_line": end,
-            "char_count": len(chunk_text),
-            "line_count": len(chunk_lines)
+            "char_count": end_char - start_char,
+            "line_count": end - start
         }
 
-        chunks.append((chunk_text, metadata))
+        yield text[start_char:end_char], metadata
 
-        start = end - overlap_lines if end < len(lines) else end
+        start = end - overlap_lines if end < total_lines else end
         chunk_num += 1
 
-    return chunks
-
 
-def chunk_by_headers(text: str, max_chunk_size: int = 200000) -> List[Tuple[str, dict]]:
+def chunk_by_headers(text: str, max_chunk_size: int = 200000) -> Iterator[Tuple[str, dict]]:
     """Split markdown text at header boundaries."""
     # Find all headers
-    header_pattern = re.compile(r'^(#{1,6})\s+(.+)$', re.MULTILINE)
-    headers = list(header_pattern.finditer(text))
+    headers = list(_HEADER_RE.finditer(text))
 
     if not headers:
         # No headers found, fall back to size-based chunking
-        return chunk_by_size(text, max_chunk_size)
+        yield from chunk_by_size(text, max_chunk_size)
+        return
 
-    chunks = []
     chunk_num = 1
 
     for i, match in enumerate(headers):
         start = match.start()
         end = headers[i + 1].start() if i + 1 < len(headers) else len(text)
 
-        section_text = text[start:end]
-
         # If section is too large, split it further
-        if len(section_text) > max_chunk_size:
-            sub_chunks = chunk_by_size(section_text, max_chunk_size)
+        if end - start > max_chunk_size:
+            sub_chunks = chunk_by_size(text, max_chunk_size, start=start, stop=end)
             for sub_text, sub_meta in sub_chunks:
                 sub_meta["chunk_num"] = chunk_num
                 sub_meta["header"] = match.group(2)[:50]
                 sub_meta["header_level"] = len(match.group(1))
-                chunks.append((sub_text, sub_meta))
+                yield sub_text, sub_meta
                 chunk_num += 1
         else:
             metadata = {
                 "chunk_num": chunk_num,
                 "start_char": start,
                 "end_char": end,
-                "char_count": len(section_text),
-                "line_count": section_text.count('\n') + 1,
+                "char_count": end - start,
+                "line_count": text.count('\n', start, end) + 1,
                 "header": match.group(2)[:50],
                 "header_level": len(match.group(1))
             }
-            chunks.append((section_text, metadata))
+            yield text[start:end], metadata
             chunk_num += 1
 
-    return chunks
-
 
-def chunk_by_paragraphs(text: str, max_chunk_size: int = 200000) -> List[Tuple[str, dict]]:
+def chunk_by_paragraphs(text: str, max_chunk_size: int = 200000) -> Iterator[Tuple[str, dict]]:
     """Split text at paragraph boundaries (double newlines)."""
-    paragraphs = re.split(r'\n\n+', text)
+    paragraphs = _PARA_SPLIT_RE.split(text)
 
-    chunks = []
     current_chunk = []
     current_size = 0
     chunk_num = 1
@@ -205,7 +311,7 @@ def chunk_by_paragraphs(text: str, max_chunk_size: int = 200000) -> List[Tuple[s
                 "char_count": len(chunk_text),
                 "paragraph_count": len(current_chunk)
             }
-            chunks.append((chunk_text, metadata))
+            yield chunk_text, metadata
             chunk_num += 1
 
             current_chunk = [para]
@@ -222,36 +328,37 @@ def chunk_by_paragraphs(text: str, max_chunk_size: int = 200000) -> List[Tuple[s
             "char_count": len(chunk_text),
             "paragraph_count": len(current_chunk)
         }
-        chunks.append((chunk_text, metadata))
-
-    return chunks
+        yield chunk_text, metadata
 
 
 def detect_language(text: str) -> str:
     """Detect programming language from code patterns."""
+    # Signatures show up near the top of a file; don't rescan a huge input
+    text = text[:_DETECT_SAMPLE_CHARS]
+
     # Python patterns
-    if re.search(r'^(def |class |import |from .+ import |async def )', text, re.MULTILINE):
-        if re.search(r':\s*$', text, re.MULTILINE):  # Python uses colons
+    if _PY_DEF_RE.search(text):
+        if _PY_COLON_RE.search(text):  # Python uses colons
             return "python"
 
     # Rust patterns (check before JS due to overlap with 'fn', 'struct')
     # Look for Rust-specific syntax: use statements, lifetimes, Result/Option, &self
-    if re.search(r'(use\s+std::|use\s+\w+::|::<|->|&self|&mut\s+self|impl\s+\w+|Result<|Option<|pub\s+fn|pub\s+struct|pub\s+enum)', text):
-        if re.search(r'^(pub\s+)?(fn|struct|enum|impl|trait|mod)\s+\w+', text, re.MULTILINE):
+    if _RUST_SYNTAX_RE.search(text):
+        if _RUST_ITEM_RE.search(text):
             return "rust"
 
     # Go patterns
-    if re.search(r'^(func\s+\w+|package\s+\w+|type\s+\w+\s+struct)', text, re.MULTILINE):
+    if _GO_RE.search(text):
         return "go"
 
     # JavaScript/TypeScript patterns
-    if re.search(r'(function\s+\w+|const\s+\w+\s*=|let\s+\w+\s*=|var\s+\w+\s*=|\=\>\s*\{)', text):
-        if re.search(r'(interface\s+\w+|type\s+\w+\s*=|:\s*(string|number|boolean|any))', text):
+    if _JS_RE.search(text):
+        if _TS_RE.search(text):
             return "typescript"
         return "javascript"
 
     # Java/Kotlin patterns
-    if re.search(r'(public\s+class|private\s+class|class\s+\w+\s*\{)', text):
+    if _JAVA_RE.search(text):
         return "java"
 
     return "unknown"
@@ -264,68 +371,19 @@ def find_code_boundaries(text: str, language: str) -> List[Tuple[int, int, str,
     """
     boundaries = []
 
-    # Language-specific patterns
-    patterns = {
-        "python": [
-            (r'^class\s+(\w+)[^:]*:', "class"),
-            (r'^(?:async\s+)?def\s+(\w+)\s*\([^)]*\)\s*(?:->[^:]+)?:', "function"),
-        ],
-        "javascript": [
-            (r'^class\s+(\w+)', "class"),
-            (r'^(?:async\s+)?function\s+(\w+)', "function"),
-            (r'^(?:const|let|var)\s+(\w+)\s*=\s*(?:async\s+)?\([^)]*\)\s*=>', "arrow_function"),
-            (r'^(?:const|let|var)\s+(\w+)\s*=\s*function', "function"),
-            (r'^export\s+(?:default\s+)?(?:async\s+)?function\s+(\w+)', "function"),
-        ],
-        "typescript": [
-            (r'^(?:export\s+)?class\s+(\w+)', "class"),
-            (r'^(?:export\s+)?interface\s+(\w+)', "interface"),
-            (r'^(?:export\s+)?type\s+(\w+)', "type"),
-            (r'^(?:export\s+)?(?:async\s+)?function\s+(\w+)', "function"),
-            (r'^(?:export\s+)?(?:const|let|var)\s+(\w+)\s*(?::\s*[^=]+)?\s*=\s*(?:async\s+)?\([^)]*\)\s*(?::\s*[^=]+)?\s*=>', "arrow_function"),
-        ],
-        "go": [
-            (r'^func\s+(?:\([^)]+\)\s+)?(\w+)', "function"),
-            (r'^type\s+(\w+)\s+struct', "struct"),
-            (r'^type\s+(\w+)\s+interface', "interface"),
-        ],
-        "rust": [
-            (r'^(?:pub\s+)?fn\s+(\w+)', "function"),
-            (r'^(?:pub\s+)?struct\s+(\w+)', "struct"),
-            (r'^(?:pub\s+)?enum\s+(\w+)', "enum"),
-            (r'^impl(?:<[^>]+>)?\s+(\w+)', "impl"),
-            (r'^(?:pub\s+)?trait\s+(\w+)', "trait"),
-        ],
-        "java": [
-            (r'^(?:public|private|protected)?\s*class\s+(\w+)', "class"),
-            (r'^(?:public|private|protected)\s+(?:static\s+)?(?:\w+(?:<[^>]+>)?)\s+(\w+)\s*\(', "method"),
-        ],
-    }
-
     # Use generic patterns if language not specifically supported
-    lang_patterns = patterns.get(language, patterns["python"])
-
-    lines = text.split('\n')
-    char_offset = 0
-
-    for line_num, line in enumerate(lines):
-        for pattern, entity_type in lang_patterns:
-            match = re.match(pattern, line.lstrip())
-            if match:
-                # Find the start of this definition
-                start = char_offset
-
-                # Get the name
-                name = match.group(1) if match.groups() else "unknown"
+    scan, entity_types = _CODE_BOUNDARY_SCANS.get(language, _CODE_BOUNDARY_SCANS["python"])
 
-                boundaries.append((start, -1, entity_type, name))  # -1 means end not yet determined
-
-        char_offset += len(line) + 1  # +1 for newline
+    # One pass over the whole text; the first matching pattern on a line wins
+    for match in scan.finditer(text):
+        group = match.lastindex
+        # -1 means end not yet determined
+        boundaries.append((match.start(), -1, entity_types[group // 2], match.group(group + 1)))
 
     return boundaries
 
 
-def chunk_by_code(text: str, max_chunk_size: int = 200000, language: str = None) -> List[Tuple[str, dict]]:
+def chunk_by_code(text: str, max_chunk_size: int = 200000, language: str = None) -> Iterator[Tuple[str, dict]]:
     """
     Split code at function/class boundaries.
     Keeps related code together (e.g., class with its methods).
@@ -338,145 +396,162 @@ def chunk_by_code(text: str, max_chunk_size: int = 200000, language: str = None)
 
     if not boundaries:
         # No code structures found, fall back to size-based chunking
-        return chunk_by_size(text, max_chunk_size)
-
-    # Calculate end positions for each boundary
-    for i in range(len(boundaries)):
-        start, _, entity_type, name = boundaries[i]
-        if i + 1 < len(boundaries):
-            end = boundaries[i + 1][0]
-        else:
-            end = len(text)
-        boundaries[i] = (start, end, entity_type, name)
-
-    # Group boundaries into chunks that fit within max_chunk_size
-    chunks = []
-    current_chunk_boundaries = []
-    current_chunk_size = 0
+        yield from chunk_by_size(text, max_chunk_size)
+        return
+
+    # Each entity ends where the next one starts; the last runs to the end of the text
+    ends = [boundary[0] for boundary in boundaries[1:]]
+    ends.append(len(text))
+
+    # Group boundaries into chunks that fit within max_chunk_size.
+    # Entities in a group are contiguous, so the group is its start, its end
+    # and the entity labels.
+    current_entities = []
+    chunk_start = chunk_end = 0
     chunk_num = 1
 
-    for start, end, entity_type, name in boundaries:
+    for (start, _, entity_type, name), end in zip(boundaries, ends):
         entity_size = end - start
 
         # If single entity is larger than max, split it with size-based chunking
         if entity_size > max_chunk_size:
             # First, save current chunk if any
-            if current_chunk_boundaries:
-                chunk_start = current_chunk_boundaries[0][0]
-                chunk_end = current_chunk_boundaries[-1][1]
-                chunk_text = text[chunk_start:chunk_end]
-
-                entities = [f"{b[2]}:{b[3]}" for b in current_chunk_boundaries]
-                metadata = {
-                    "chunk_num": chunk_num,
-                    "start_char": chunk_start,
-                    "end_char": chunk_end,
-                    "char_count": len(chunk_text),
-                    "line_count": chunk_text.count('\n') + 1,
-                    "language": language,
-                    "entities": entities,
-                    "entity_count": len(entities)
-                }
-                chunks.append((chunk_text, metadata))
+            if current_entities:
+                yield _code_chunk(text, chunk_num, chunk_start, chunk_end, language, current_entities)
                 chunk_num += 1
-                current_chunk_boundaries = []
-                current_chunk_size = 0
+                current_entities = []
 
             # Split the large entity
-            large_entity_text = text[start:end]
-            sub_chunks = chunk_by_size(large_entity_text, max_chunk_size)
+            sub_chunks = chunk_by_size(text, max_chunk_size, start=start, stop=end)
             for sub_text, sub_meta in sub_chunks:
                 sub_meta["chunk_num"] = chunk_num
                 sub_meta["language"] = language
                 sub_meta["entities"] = [f"{entity_type}:{name} (part {sub_meta.get('chunk_num', '?')})"]
                 sub_meta["entity_count"] = 1
-                chunks.append((sub_text, sub_meta))
+                yield sub_text, sub_meta
                 chunk_num += 1
             continue
 
         # Check if adding this entity would exceed max size
-        if current_chunk_size + entity_size > max_chunk_size and current_chunk_boundaries:
+        if current_entities and end - chunk_start > max_chunk_size:
             # Save current chunk
-            chunk_start = current_chunk_boundaries[0][0]
-            chunk_end = current_chunk_boundaries[-1][1]
-            chunk_text = text[chunk_start:chunk_end]
-
-            entities = [f"{b[2]}:{b[3]}" for b in current_chunk_boundaries]
-            metadata = {
-                "chunk_num": chunk_num,
-                "start_char": chunk_start,
-                "end_char": chunk_end,
-                "char_count": len(chunk_text),
-                "line_count": chunk_text.count('\n') + 1,
-                "language": language,
-                "entities": entities,
-                "entity_count": len(entities)
-            }
-            chunks.append((chunk_text, metadata))
+            yield _code_chunk(text, chunk_num, chunk_start, chunk_end, language, current_entities)
             chunk_num += 1
+            current_entities = []
 
+        if not current_entities:
             # Start new chunk
-            current_chunk_boundaries = [(start, end, entity_type, name)]
-            current_chunk_size = entity_size
-        else:
-            current_chunk_boundaries.append((start, end, entity_type, name))
-            current_chunk_size += entity_size
+            chunk_start = start
+        current_entities.append(f"{entity_type}:{name}")
+        chunk_end = end
 
     # Don't forget the last chunk
-    if current_chunk_boundaries:
-        chunk_start = current_chunk_boundaries[0][0]
-        chunk_end = current_chunk_boundaries[-1][1]
-        chunk_text = text[chunk_start:chunk_end]
-
-        entities = [f"{b[2]}:{b[3]}" for b in current_chunk_boundaries]
-        metadata = {
-            "chunk_num": chunk_num,
-            "start_char": chunk_start,
-            "end_char": chunk_end,
-            "char_count": len(chunk_text),
-            "line_count": chunk_text.count('\n') + 1,
-            "language": language,
-            "entities": entities,
-            "entity_count": len(entities)
-        }
-        chunks.append((chunk_text, metadata))
-
-    return chunks
+    if current_entities:
+        yield _code_chunk(text, chunk_num, chunk_start, chunk_end, language, current_entities)
+
+
+def _code_chunk(text: str, chunk_num: int, chunk_start: int, chunk_end: int,
+                language: str, entities: List[str]) -> Tuple[str, dict]:
+    """Build one chunk_by_code chunk spanning text[chunk_start:chunk_end]."""
+    metadata = {
+        "chunk_num": chunk_num,
+        "start_char": chunk_start,
+        "end_char": chunk_end,
+        "char_count": chunk_end - chunk_start,
+        "line_count": text.count('\n', chunk_start, chunk_end) + 1,
+        "language": language,
+        "entities": entities,
+        "entity_count": len(entities)
+    }
+    return text[chunk_start:chunk_end], metadata
 
 
-def save_chunks(chunks: List[Tuple[str, dict]], output_dir: str, prefix: str = "chunk", show_progress: bool = False) -> dict:
-    """Save chunks to files and return manifest."""
-    output_path = Path(output_dir)
-    output_path.mkdir(parents=True, exist_ok=True)
-
-    manifest = {
-        "total_chunks": len(chunks),
-        "chunks": []
+def read_text(path: Path) -> str:
+    """
+    Read a file as UTF-8 text, decoding straight from a read-only mmap.
+    Newlines are normalized the way text-mode open() does.
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            text = str(mm, 'utf-8', 'ignore')
+
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+def _write_chunk(output_path: Path, prefix: str, chunk: Tuple[str, dict]) -> dict:
+    """Write one chunk file and return its manifest entry; output_path is absolute."""
+    chunk_text, metadata = chunk
+    filename = f"{prefix}_{metadata['chunk_num']:03d}.txt"
+    filepath = output_path / filename
+
+    # Encode up front and write bytes; skips the per-file TextIOWrapper
+    with open(filepath, 'wb') as f:
+        f.write(chunk_text.encode('utf-8'))
+
+    return {
+        "filename": filename,
+        "path": str(filepath),
+        **metadata
     }
 
-    progress = ProgressTracker(len(chunks), "Saving chunks", show_progress) if show_progress else None
 
-    for chunk_text, metadata in chunks:
-        filename = f"{prefix}_{metadata['chunk_num']:03d}.txt"
-        filepath = output_path / filename
+def save_chunks(chunks: Iterable[Tuple[str, dict]], output_dir: str, prefix: str = "chunk", show_progress: bool = False) -> dict:
+    """
+    Save chunks to files and return manifest.
+    chunks may be a generator; each chunk is released once its file is written.
+    """
+    # Resolved against the cwd once, not per chunk
+    output_path = Path(output_dir).absolute()
+    output_path.mkdir(parents=True, exist_ok=True)
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(chunk_text)
+    total = len(chunks) if hasattr(chunks, '__len__') else None
+    progress = ProgressTracker(total, "Saving chunks", show_progress) if show_progress else None
 
-        chunk_info = {
-            "filename": filename,
-            "path": str(filepath.absolute()),
-            **metadata
-        }
-        manifest["chunks"].append(chunk_info)
+    entries = []
 
+    def collect(future):
+        chunk_info = future.result()
+        entries.append(chunk_info)
         if progress:
-            progress.update(item_name=filename)
+            progress.update(item_name=chunk_info["filename"])
+
+    # Write files concurrently, but keep only a bounded window of chunks in
+    # flight so a generator is never drained into memory; collecting futures
+    # oldest first keeps the manifest in chunk order
+    max_workers = min(32, (os.cpu_count() or 4) * 4)
+    if total is not None:
+        max_workers = min(max_workers, max(total, 1))
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for chunk in chunks:
+            pending.append(executor.submit(_write_chunk, output_path, prefix, chunk))
+            if len(pending) >= 2 * max_workers:
+                collect(pending.popleft())
+        while pending:
+            collect(pending.popleft())
+
+    if progress and total is None:
+        # Count is known now; draw the completed bar
+        progress.total = progress.current
+        progress.update(0)
+
+    manifest = {
+        "total_chunks": len(entries),
+        "chunks": entries
+    }
 
     # Save manifest
     manifest_path = output_path / "manifest.json"
-    with open(manifest_path, 'w') as f:
-        json.dump(manifest, f, indent=2)
+    if HAS_ORJSON:
+        data = orjson.dumps(manifest, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(manifest, indent=2).encode()
+    with open(manifest_path, 'wb') as f:
+        f.write(data)
 
     return manifest
 
@@ -513,8 +588,7 @@ def main():
         print(f"Error: File not found: {args.input_file}")
         sys.exit(1)
 
-    with open(input_path, 'r', encoding='utf-8', errors='ignore') as f:
-        text = f.read()
+    text = read_text(input_path)
 
     print(f"Input: {args.input_file} ({len(text):,} chars)")
 
@@ -532,11 +606,11 @@ def main():
         print(f"Detected/using language: {language}")
         chunks = chunk_by_code(text, args.size, language)
 
-    print(f"Created {len(chunks)} chunks using '{args.strategy}' strategy")
-
-    # Save chunks
+    # Chunks are generated lazily and written as they are produced
     manifest = save_chunks(chunks, args.output, args.prefix, show_progress=args.progress)
 
+    print(f"Created {manifest['total_chunks']} chunks using '{args.strategy}' strategy")
+
     if args.json:
         print(json.dumps(manifest, indent=2))
     else:
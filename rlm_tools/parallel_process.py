@@ -14,13 +14,30 @@ Output:
 """
 
 import argparse
+import io
 import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import List, Dict, Any
 import time
 
+# Try to import orjson for faster JSON output, fall back to stdlib json
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def dumps_indented(obj: Any) -> str:
+    """Serialize obj as JSON with 2-space indentation."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
 
 def load_manifest(manifest_path: str) -> Dict[str, Any]:
     """Load chunk manifest."""
@@ -36,27 +53,14 @@ def create_batches(chunks: List[Dict], batch_size: int) -> List[List[Dict]]:
     return batches
 
 
-def generate_batch_prompt(batch: List[Dict], query: str, batch_num: int, total_batches: int) -> str:
-    """Generate a prompt for processing a batch of chunks."""
-    chunk_info = []
-    for chunk in batch:
-        # Include entity info if available (from semantic chunking)
-        entities = chunk.get('entities', [])
-        entity_str = f" | Entities: {', '.join(entities)}" if entities else ""
-        chunk_info.append(f"  - {chunk['filename']}: {chunk['char_count']:,} chars{entity_str}")
-
-    chunk_list = '\n'.join(chunk_info)
-    chunk_paths = [chunk['path'] for chunk in batch]
-
-    prompt = f"""You are processing batch {batch_num}/{total_batches} for an RLM (Reading Language Model) analysis.
+def generate_prompt_preamble(query: str) -> str:
+    """Generate the part of every batch prompt that does not depend on the batch."""
+    return f"""You are processing one batch of an RLM (Reading Language Model) analysis.
 
 QUERY: {query}
 
-CHUNKS IN THIS BATCH:
-{chunk_list}
-
 INSTRUCTIONS:
-1. Read each chunk file listed above
+1. Read each chunk file listed below
 2. Analyze the content for information relevant to the query
 3. Extract specific findings with:
    - Location (chunk filename, line number if possible)
@@ -64,13 +68,10 @@ INSTRUCTIONS:
    - Relevance (how it relates to the query)
 4. Return findings as a JSON array
 
-CHUNK PATHS TO READ:
-{json.dumps(chunk_paths, indent=2)}
-
-Return your findings in this format:
+Return your findings in this format, with "batch" set to the number in YOUR BATCH below:
 ```json
 {{
-  "batch": {batch_num},
+  "batch": <your batch number>,
   "findings": [
     {{
       "location": "chunk_001.txt:45",
@@ -82,8 +83,38 @@ Return your findings in this format:
   "summary": "Brief summary of what was found in this batch"
 }}
 ```
+
 """
-    return prompt
+
+
+def generate_batch_prompt_tail(batch: List[Dict], batch_num: int, total_batches: int,
+                               chunk_paths: List[str] = None) -> str:
+    """
+    Generate the batch-specific part of a prompt.
+    The full prompt is the shared preamble followed by this text.
+    chunk_paths may be passed in when the caller already has them.
+    """
+    if chunk_paths is None:
+        chunk_paths = [chunk['path'] for chunk in batch]
+
+    # Written into one buffer instead of joining a list of lines
+    buf = io.StringIO()
+    buf.write(f"YOUR BATCH: {batch_num}/{total_batches}\n\nCHUNKS IN THIS BATCH:\n")
+    for chunk in batch:
+        # Include entity info if available (from semantic chunking)
+        entities = chunk.get('entities', [])
+        entity_str = f" | Entities: {', '.join(entities)}" if entities else ""
+        buf.write(f"  - {chunk['filename']}: {chunk['char_count']:,} chars{entity_str}\n")
+
+    buf.write("\nCHUNK PATHS TO READ:\n")
+    buf.write(dumps_indented(chunk_paths))
+    buf.write("\n")
+    return buf.getvalue()
+
+
+def full_batch_prompt(config: Dict[str, Any], batch: Dict[str, Any]) -> str:
+    """Join the shared preamble and a batch's own prompt text."""
+    return config['preamble'] + batch['prompt']
 
 
 def generate_parallel_config(manifest_path: str, query: str, batch_size: int = 4,
@@ -102,15 +133,23 @@ def generate_parallel_config(manifest_path: str, query: str, batch_size: int = 4
         "total_batches": len(batches),
         "batch_size": batch_size,
         "output_dir": output_dir,
+        # Stored once; each batch keeps only its own part of the prompt
+        "preamble": generate_prompt_preamble(query),
         "batches": []
     }
 
+    # Read each manifest field once into a column; batches take slices of it
+    filenames = [c['filename'] for c in chunks]
+    paths = [c['path'] for c in chunks]
+
     for i, batch in enumerate(batches, 1):
+        lo = (i - 1) * batch_size
+        chunk_paths = paths[lo:lo + batch_size]
         batch_config = {
             "batch_num": i,
-            "chunks": [c['filename'] for c in batch],
-            "chunk_paths": [c['path'] for c in batch],
-            "prompt": generate_batch_prompt(batch, query, i, len(batches)),
+            "chunks": filenames[lo:lo + batch_size],
+            "chunk_paths": chunk_paths,
+            "prompt": generate_batch_prompt_tail(batch, i, len(batches), chunk_paths),
             "output_file": f"{output_dir}/batch_{i:03d}_results.json"
         }
         config["batches"].append(batch_config)
@@ -148,15 +187,25 @@ in parallel rather than sequentially.
     print("=" * 70)
 
 
+def _write_prompt(config: Dict[str, Any], output_dir: str, batch: Dict[str, Any]) -> str:
+    """Write one batch prompt file and return its path."""
+    prompt_file = f"{output_dir}/batch_{batch['batch_num']:03d}_prompt.txt"
+    with open(prompt_file, 'w') as f:
+        f.write(full_batch_prompt(config, batch))
+    return prompt_file
+
+
 def save_batch_prompts(config: Dict[str, Any], output_dir: str):
     """Save individual batch prompts to files for easy loading."""
     Path(output_dir).mkdir(parents=True, exist_ok=True)
 
-    for batch in config['batches']:
-        prompt_file = f"{output_dir}/batch_{batch['batch_num']:03d}_prompt.txt"
-        with open(prompt_file, 'w') as f:
-            f.write(batch['prompt'])
-        print(f"  Saved: {prompt_file}")
+    batches = config['batches']
+
+    # Write files concurrently; map() keeps the report in batch order
+    max_workers = min(32, (os.cpu_count() or 4) * 4, max(len(batches), 1))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for prompt_file in executor.map(partial(_write_prompt, config, output_dir), batches):
+            print(f"  Saved: {prompt_file}")
 
 
 def main():
@@ -172,7 +221,8 @@ def main():
     parser.add_argument("--save-prompts", "-s", action="store_true",
                         help="Save batch prompts to individual files")
     parser.add_argument("--json", action="store_true",
-                        help="Output full config as JSON")
+                        help="Output full config as JSON (each batch's full prompt is "
+                             "config[\"preamble\"] + batch[\"prompt\"])")
 
     args = parser.parse_args()
 
@@ -192,7 +242,7 @@ def main():
     Path(config['output_dir']).mkdir(parents=True, exist_ok=True)
 
     if args.json:
-        print(json.dumps(config, indent=2))
+        print(dumps_indented(config))
     else:
         print_parallel_instructions(config)
 
@@ -218,8 +268,12 @@ Estimated speedup: {config['total_batches']}x faster than sequential processing
 
     # Save config for reference
     config_path = f"{config['output_dir']}/parallel_config.json"
-    with open(config_path, 'w') as f:
-        json.dump(config, f, indent=2)
+    if HAS_ORJSON:
+        data = orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(config, indent=2).encode()
+    with open(config_path, 'wb') as f:
+        f.write(data)
     print(f"\nConfig saved to: {config_path}")
 
 
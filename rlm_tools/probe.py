@@ -6,6 +6,8 @@ Usage:
     python probe.py <input_file>
     python probe.py input.txt
     python probe.py document.pdf  # Extracts text first
+    python probe.py --batch "corpus/**/*.md"  # Probe many files in parallel
+    python probe.py --batch paths.txt  # One path per line
 
 Outputs structure analysis: character count, line count, estimated tokens,
 detected format, and recommended chunk size.
@@ -14,19 +16,78 @@ detected format, and recommended chunk size.
 import argparse
 import json
 import os
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from glob import glob
 from pathlib import Path
+from typing import List, Sized
 
+# Add rlm_tools directory to path for chunk.py's file reader
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from chunk import read_text
 
-def count_tokens_estimate(text: str) -> int:
-    """Rough token estimate: ~4 chars per token for English text."""
+# Inputs up to this many characters are fully parsed to confirm they are JSON;
+# larger ones are only checked for matching outer brackets
+_JSON_PARSE_LIMIT = 1 << 20
+
+_NON_SPACE_RE = re.compile(r'\S')
+
+# Lines that start a header or separator, or a blank line followed by another
+# blank line (a paragraph break on the second one)
+_BOUNDARY_RE = re.compile(r'^(?:(#[^\n]*)|((?:---|===)[^\n]*)|[^\S\n]*\n(?=[^\S\n]*$))', re.MULTILINE)
+
+# Chunking strategy and reason for each detected format
+_CHUNK_STRATEGIES = {
+    "markdown": ("by_headers", "Markdown detected - chunk at header boundaries"),
+    "json": ("by_elements", "JSON detected - chunk by top-level elements"),
+    "code": ("by_functions", "Code detected - chunk by function/class boundaries"),
+}
+_DEFAULT_CHUNK_STRATEGY = ("by_size", "Plain text - chunk by character count")
+
+
+def count_tokens_estimate(text: Sized) -> int:
+    """
+    Rough token estimate: ~4 chars per token for English text.
+    Only len() is used (O(1)), so a str, bytes or mmap all work.
+    """
     return len(text) // 4
 
 
+def _has_header_line(text: str, max_lines: int) -> bool:
+    """Check whether any of the first max_lines lines starts with '#'."""
+    pos = 0
+    for _ in range(max_lines):
+        if text.startswith('#', pos):
+            return True
+        pos = text.find('\n', pos) + 1
+        if pos == 0:
+            return False
+    return False
+
+
+def _is_json(text: str) -> bool:
+    """Check whether text is a JSON document, without parsing very large inputs."""
+    if len(text) <= _JSON_PARSE_LIMIT:
+        # stdlib json on purpose: it accepts NaN/Infinity and lone surrogates,
+        # which orjson rejects. Deep nesting raises RecursionError.
+        try:
+            json.loads(text)
+            return True
+        except (ValueError, RecursionError):
+            return False
+
+    first = _NON_SPACE_RE.search(text)
+    if not first or first.group() not in '{[':
+        return False
+    end = len(text) - 1
+    while text[end].isspace():
+        end -= 1
+    return text[end] == ('}' if first.group() == '{' else ']')
+
+
 def detect_format(text: str, filename: str) -> dict:
     """Detect the structure/format of the input."""
-    lines = text.split('\n')
-
     # Check for common formats
     format_info = {
         "type": "unknown",
@@ -38,11 +99,10 @@ def detect_format(text: str, filename: str) -> dict:
     # Check file extension
     ext = Path(filename).suffix.lower()
     if ext == '.json':
-        try:
-            json.loads(text)
+        if _is_json(text):
             format_info["type"] = "json"
             format_info["is_structured"] = True
-        except:
+        else:
             format_info["type"] = "text"
     elif ext == '.csv':
         format_info["type"] = "csv"
@@ -50,21 +110,18 @@ def detect_format(text: str, filename: str) -> dict:
         format_info["delimiter"] = ","
     elif ext == '.md':
         format_info["type"] = "markdown"
-        format_info["has_headers"] = any(line.startswith('#') for line in lines[:50])
+        format_info["has_headers"] = _has_header_line(text, 50)
     elif ext in ['.py', '.js', '.ts', '.java', '.cpp', '.c', '.go', '.rs']:
         format_info["type"] = "code"
         format_info["is_structured"] = True
     else:
         # Try to detect from content
-        if text.strip().startswith('{') or text.strip().startswith('['):
-            try:
-                json.loads(text)
-                format_info["type"] = "json"
-                format_info["is_structured"] = True
-            except:
-                pass
-
-        if any(line.startswith('#') for line in lines[:20]):
+        first = _NON_SPACE_RE.search(text)
+        if first and first.group() in '{[' and _is_json(text):
+            format_info["type"] = "json"
+            format_info["is_structured"] = True
+
+        if _has_header_line(text, 20):
             format_info["type"] = "markdown"
             format_info["has_headers"] = True
 
@@ -74,20 +131,27 @@ def detect_format(text: str, filename: str) -> dict:
 def find_natural_boundaries(text: str) -> list:
     """Find natural chunk boundaries (headers, sections, paragraphs)."""
     boundaries = []
-    lines = text.split('\n')
+    line = 0
+    pos = 0
+
+    for match in _BOUNDARY_RE.finditer(text):
+        # Advance the line number only as far as this match
+        line += text.count('\n', pos, match.start())
+        pos = match.start()
+
+        header, separator = match.group(1), match.group(2)
+        if header is not None:
+            boundaries.append({"line": line, "type": "header", "text": header[:50]})
+        elif separator is not None:
+            boundaries.append({"line": line, "type": "separator", "text": separator[:20]})
+        else:
+            # Matched the first of two blank lines; the break is the second
+            boundaries.append({"line": line + 1, "type": "paragraph_break", "text": ""})
 
-    for i, line in enumerate(lines):
-        # Markdown headers
-        if line.startswith('#'):
-            boundaries.append({"line": i, "type": "header", "text": line[:50]})
-        # Double newlines (paragraph breaks)
-        elif i > 0 and line.strip() == '' and lines[i-1].strip() == '':
-            boundaries.append({"line": i, "type": "paragraph_break", "text": ""})
-        # Document markers
-        elif line.startswith('---') or line.startswith('==='):
-            boundaries.append({"line": i, "type": "separator", "text": line[:20]})
+        if len(boundaries) == 20:
+            break
 
-    return boundaries[:20]  # Return first 20 boundaries
+    return boundaries  # First 20 boundaries
 
 
 def recommend_chunk_size(char_count: int, line_count: int, format_type: str) -> dict:
@@ -104,36 +168,13 @@ def recommend_chunk_size(char_count: int, line_count: int, format_type: str) ->
             "estimated_chunks": 1
         }
 
-    num_chunks = (char_count // target_chunk_chars) + 1
-
-    if format_type == "markdown":
-        return {
-            "strategy": "by_headers",
-            "reason": "Markdown detected - chunk at header boundaries",
-            "chunk_size": target_chunk_chars,
-            "estimated_chunks": num_chunks
-        }
-    elif format_type == "json":
-        return {
-            "strategy": "by_elements",
-            "reason": "JSON detected - chunk by top-level elements",
-            "chunk_size": target_chunk_chars,
-            "estimated_chunks": num_chunks
-        }
-    elif format_type == "code":
-        return {
-            "strategy": "by_functions",
-            "reason": "Code detected - chunk by function/class boundaries",
-            "chunk_size": target_chunk_chars,
-            "estimated_chunks": num_chunks
-        }
-    else:
-        return {
-            "strategy": "by_size",
-            "reason": "Plain text - chunk by character count",
-            "chunk_size": target_chunk_chars,
-            "estimated_chunks": num_chunks
-        }
+    strategy, reason = _CHUNK_STRATEGIES.get(format_type, _DEFAULT_CHUNK_STRATEGY)
+    return {
+        "strategy": strategy,
+        "reason": reason,
+        "chunk_size": target_chunk_chars,
+        "estimated_chunks": (char_count // target_chunk_chars) + 1
+    }
 
 
 def probe_file(filepath: str) -> dict:
@@ -145,15 +186,13 @@ def probe_file(filepath: str) -> dict:
 
     # Read file
     try:
-        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
-            text = f.read()
+        text = read_text(path)
     except Exception as e:
         return {"error": f"Failed to read file: {e}"}
 
     # Basic stats
     char_count = len(text)
-    lines = text.split('\n')
-    line_count = len(lines)
+    line_count = text.count('\n') + 1
     token_estimate = count_tokens_estimate(text)
 
     # Format detection
@@ -184,16 +223,49 @@ def probe_file(filepath: str) -> dict:
     }
 
 
+def resolve_batch_paths(batch: str) -> List[str]:
+    """Expand a --batch argument: a file listing one path per line, or a glob pattern."""
+    if Path(batch).is_file():
+        with open(batch, 'r') as f:
+            return [line.strip() for line in f if line.strip()]
+    return sorted(glob(batch, recursive=True))
+
+
+def probe_files(paths: List[str]) -> List[dict]:
+    """Probe several files across a process pool; results keep the order of paths."""
+    if len(paths) <= 1:
+        return [probe_file(path) for path in paths]
+
+    workers = os.cpu_count() or 1
+    chunksize = max(1, len(paths) // (workers * 4))
+    with ProcessPoolExecutor() as executor:
+        return list(executor.map(probe_file, paths, chunksize=chunksize))
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Analyze input structure for RLM processing"
     )
-    parser.add_argument("input_file", help="File to analyze")
+    parser.add_argument("input_file", nargs="?", help="File to analyze")
+    parser.add_argument("--batch", help="Glob pattern or file of paths to analyze in parallel (JSON array output)")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
     parser.add_argument("--save", help="Save analysis to file")
 
     args = parser.parse_args()
 
+    if args.batch:
+        output = json.dumps(probe_files(resolve_batch_paths(args.batch)), indent=2)
+        if args.save:
+            with open(args.save, 'w') as f:
+                f.write(output)
+            print(f"Analysis saved to {args.save}")
+        else:
+            print(output)
+        return
+
+    if not args.input_file:
+        parser.error("input_file is required unless --batch is given")
+
     result = probe_file(args.input_file)
 
     if args.json or args.save:
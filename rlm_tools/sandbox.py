@@ -13,7 +13,9 @@ Blocks: file I/O, network, dangerous imports, system calls.
 
 import argparse
 import json
+import re
 import sys
+from functools import lru_cache
 from io import StringIO
 from typing import Dict, Any, Optional
 
@@ -76,15 +78,49 @@ SAFE_BUILTINS = {
 }
 
 
+# Execution environment shared by every run; execute() copies it and adds
+# the sandbox variables and per-run print/range
+_BASE_ENV = dict(SAFE_BUILTINS)
+if HAS_RESTRICTED_PYTHON:
+    _BASE_ENV['_getiter_'] = default_guarded_getiter
+    _BASE_ENV['_getitem_'] = default_guarded_getitem
+    _BASE_ENV['_iter_unpack_sequence_'] = guarded_iter_unpack_sequence
+
+# Names a custom variable may not shadow
+_RESERVED_NAMES = {'__builtins__', '__import__', 'eval', 'exec', 'compile',
+                   '_getiter_', '_getitem_', '_iter_unpack_sequence_'}
+
+# Stands in for a variable that did not exist before execution
+_MISSING = object()
+
+# Substrings blocked when RestrictedPython is unavailable
+DANGEROUS_PATTERNS = ['import ', 'exec(', 'eval(', 'compile(', '__', 'open(',
+                      'file(', 'input(', 'globals(', 'locals(', 'vars(',
+                      'getattr', 'setattr', 'delattr', 'subprocess', 'os.',
+                      'sys.', 'socket', 'urllib', 'requests']
+
+# All patterns in one alternation, so the code is scanned once
+_DANGEROUS_RE = re.compile('|'.join(map(re.escape, DANGEROUS_PATTERNS)))
+
+
+@lru_cache(maxsize=128)
+def _compile_restricted_exec(code: str):
+    """Compile sandbox code with RestrictedPython; repeated snippets reuse the result."""
+    return compile_restricted(code, '<sandbox>', 'exec')
+
+
 class CapturedOutput:
     """Captures print() output."""
 
     def __init__(self):
         self.outputs = []
+        # Length of get_output(), kept so callers need not join to measure it
+        self.total_len = 0
 
     def write(self, text):
         if text.strip():
             self.outputs.append(text)
+            self.total_len += len(text)
 
     def flush(self):
         pass
@@ -107,7 +143,7 @@ class RLMSandbox:
 
     def set_variable(self, name: str, value: Any):
         """Set a custom variable."""
-        if name not in ['__builtins__', '__import__', 'eval', 'exec', 'compile']:
+        if name not in _RESERVED_NAMES:
             self.variables[name] = value
 
     def get_variable(self, name: str) -> Any:
@@ -121,13 +157,13 @@ class RLMSandbox:
         captured = CapturedOutput()
 
         # Build execution environment
-        safe_env = SAFE_BUILTINS.copy()
+        safe_env = _BASE_ENV.copy()
         safe_env.update(self.variables)
 
         # Add captured print
         def safe_print(*args, **kwargs):
             output = ' '.join(str(arg) for arg in args)
-            if len(captured.get_output()) + len(output) < self.max_output_chars:
+            if captured.total_len + len(output) < self.max_output_chars:
                 captured.write(output + '\n')
             else:
                 captured.write("[OUTPUT TRUNCATED]\n")
@@ -155,39 +191,31 @@ class RLMSandbox:
         try:
             if HAS_RESTRICTED_PYTHON:
                 # Use RestrictedPython for better security
-                byte_code = compile_restricted(code, '<sandbox>', 'exec')
+                byte_code = _compile_restricted_exec(code)
                 if byte_code.errors:
                     result["error"] = f"Compilation errors: {byte_code.errors}"
                     return result
 
-                # Add RestrictedPython guards
-                safe_env['_getiter_'] = default_guarded_getiter
-                safe_env['_getitem_'] = default_guarded_getitem
-                safe_env['_iter_unpack_sequence_'] = guarded_iter_unpack_sequence
-
                 exec(byte_code.code, safe_env)
             else:
                 # Basic restricted execution
                 # Block dangerous patterns
-                dangerous = ['import ', 'exec(', 'eval(', 'compile(', '__', 'open(',
-                            'file(', 'input(', 'globals(', 'locals(', 'vars(',
-                            'getattr', 'setattr', 'delattr', 'subprocess', 'os.',
-                            'sys.', 'socket', 'urllib', 'requests']
-
-                for pattern in dangerous:
-                    if pattern in code:
-                        result["error"] = f"Blocked pattern: {pattern}"
-                        return result
+                match = _DANGEROUS_RE.search(code)
+                if match:
+                    result["error"] = f"Blocked pattern: {match.group(0)}"
+                    return result
 
                 exec(code, {"__builtins__": {}}, safe_env)
 
             result["success"] = True
             result["output"] = captured.get_output()
 
-            # Track modified variables
+            # Track modified variables. safe_env started with the same objects as
+            # self.variables, so an identity check finds rebinds without deep-comparing
+            # large values such as context
             for key, value in safe_env.items():
                 if key not in SAFE_BUILTINS and key != 'print' and not key.startswith('_'):
-                    if key not in self.variables or self.variables[key] != value:
+                    if self.variables.get(key, _MISSING) is not value:
                         self.variables[key] = value
                         result["variables_modified"].append(key)
 